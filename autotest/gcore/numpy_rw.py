@@ -601,7 +601,7 @@ def test_numpy_rw_17():
 
 def test_numpy_rw_18():
 
-    img = numpy.random.randint(0, 255, size=(256, 200, 3)).astype('uint8')
+    img = numpy.random.randint(0, 255, size=(256, 200, 3), dtype=numpy.uint8)
     ds = gdal_array.OpenArray(img, interleave='pixel')
     assert ds is not None, 'Failed to open memory array as dataset.'
 
@@ -653,14 +653,17 @@ def test_rasterio_11():
     mem_ds = gdal.GetDriverByName('MEM').Create('', 4, 3)
     mem_ds.GetRasterBand(1).WriteArray(numpy.array([[80, 125, 125, 80], [80, 125, 125, 80], [80, 125, 125, 80]]))
 
+    # Pre-allocate the output buffer and reuse it for both reads
+    ar = numpy.zeros((3, 8), dtype=numpy.uint8)
+
     # A bit dummy
     mem_ds.GetRasterBand(1).SetMetadataItem('NBITS', '8', 'IMAGE_STRUCTURE')
-    ar = mem_ds.GetRasterBand(1).ReadAsArray(0, 0, 4, 3, 8, 3, resample_alg=gdal.GRIORA_Cubic)
+    mem_ds.GetRasterBand(1).ReadAsArray(0, 0, 4, 3, buf_obj=ar, resample_alg=gdal.GRIORA_Cubic)
     assert ar.max() == 129
 
     # NBITS=7
     mem_ds.GetRasterBand(1).SetMetadataItem('NBITS', '7', 'IMAGE_STRUCTURE')
-    ar = mem_ds.GetRasterBand(1).ReadAsArray(0, 0, 4, 3, 8, 3, resample_alg=gdal.GRIORA_Cubic)
+    mem_ds.GetRasterBand(1).ReadAsArray(0, 0, 4, 3, buf_obj=ar, resample_alg=gdal.GRIORA_Cubic)
     # Would overshoot to 129 if NBITS was ignored
     assert ar.max() == 127
 
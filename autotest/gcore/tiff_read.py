@@ -38,6 +38,18 @@ import webserver
 import gdaltest
 from osgeo import gdal, osr
 
+
+# Fetch the GTiff driver metadata only once, as it is a fairly large dict
+# and is consulted by many capability checks below
+_gtiff_drv_md = None
+
+def gtiff_drv_metadata():
+    global _gtiff_drv_md
+    if _gtiff_drv_md is None:
+        _gtiff_drv_md = gdal.GetDriverByName('GTiff').GetMetadata()
+    return _gtiff_drv_md
+
+
 init_list = [
     ('byte.tif', 1, 4672),
     ('uint16_sgilog.tif', 1, 4672),
@@ -237,7 +249,7 @@ def test_tiff_read_cmyk_raw():
 
 def test_tiff_read_ojpeg():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('JPEG') == -1:
         pytest.skip()
 
@@ -985,7 +997,7 @@ def test_tiff_read_exif_and_gps():
 
 
 def test_tiff_jpeg_rgba_pixel_interleaved():
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('JPEG') == -1:
         pytest.skip()
 
@@ -1007,7 +1019,7 @@ def test_tiff_jpeg_rgba_pixel_interleaved():
 
 
 def test_tiff_jpeg_rgba_band_interleaved():
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('JPEG') == -1:
         pytest.skip()
 
@@ -1029,7 +1041,7 @@ def test_tiff_jpeg_rgba_band_interleaved():
 
 
 def test_tiff_read_online_1():
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('JPEG') == -1:
         pytest.skip()
 
@@ -1155,7 +1167,7 @@ def test_tiff_read_bigtiff():
 
 def test_tiff_read_tiff_metadata():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('JPEG') == -1:
         pytest.skip()
 
@@ -1178,7 +1190,7 @@ def test_tiff_read_tiff_metadata():
 
 def test_tiff_read_irregular_tile_size_jpeg_in_tiff():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('JPEG') == -1:
         pytest.skip()
 
@@ -2570,7 +2582,7 @@ def test_tiff_read_minimum_tiff_tags_with_warning():
 
 def check_libtiff_internal_or_at_least(expected_maj, expected_min, expected_micro):
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['LIBTIFF'] == 'INTERNAL':
         return True
     if md['LIBTIFF'].startswith('LIBTIFF, Version '):
@@ -2713,7 +2725,7 @@ def test_tiff_read_huge_tile():
 
 def test_tiff_read_huge_number_strips():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['LIBTIFF'] != 'INTERNAL':
         pytest.skip()
 
@@ -2739,7 +2751,7 @@ def test_tiff_read_huge_implied_number_strips():
 
 def test_tiff_read_many_blocks():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['LIBTIFF'] != 'INTERNAL':
         pytest.skip()
 
@@ -2755,7 +2767,7 @@ def test_tiff_read_many_blocks():
 
 def test_tiff_read_many_blocks_truncated():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['LIBTIFF'] != 'INTERNAL':
         pytest.skip()
 
@@ -3023,7 +3035,7 @@ def test_tiff_read_negative_scaley():
 
 def test_tiff_read_zstd():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('ZSTD') == -1:
         pytest.skip()
 
@@ -3036,7 +3048,7 @@ def test_tiff_read_zstd():
 
 def test_tiff_read_zstd_corrupted():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('ZSTD') == -1:
         pytest.skip()
 
@@ -3050,7 +3062,7 @@ def test_tiff_read_zstd_corrupted():
 
 def test_tiff_read_zstd_corrupted2():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('ZSTD') == -1:
         pytest.skip()
 
@@ -3065,7 +3077,7 @@ def test_tiff_read_zstd_corrupted2():
 
 def test_tiff_read_webp():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('WEBP') == -1:
         pytest.skip()
     stats = (0, 215, 66.38, 47.186)
@@ -3080,7 +3092,7 @@ def test_tiff_read_webp():
 
 def test_tiff_read_webp_huge_single_strip():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('WEBP') == -1:
         pytest.skip()
     ds = gdal.Open('data/tif_webp_huge_single_strip.tif')
@@ -3100,7 +3112,7 @@ def test_tiff_read_1bit_2bands():
 
 def test_tiff_read_lerc():
 
-    md = gdal.GetDriverByName('GTiff').GetMetadata()
+    md = gtiff_drv_metadata()
     if md['DMD_CREATIONOPTIONLIST'].find('LERC') == -1:
         pytest.skip()
 
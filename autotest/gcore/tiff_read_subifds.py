@@ -54,20 +54,14 @@ def test_tiff_read_subifds():
     data = ds.GetRasterBand(1).GetOverview(1).ReadRaster(buf_xsize=1,buf_ysize=1, xsize=1, ysize=1,buf_type=gdal.GDT_Int16)
     assert struct.unpack('H', data)[0] == 12
 
-    ds = gdal.Open('GTIFF_DIR:1:data/tiff_with_subifds.tif')
-    assert ds.GetRasterBand(1).Checksum() == 35731
-
-    data = ds.GetRasterBand(1).ReadRaster(buf_xsize=1,buf_ysize=1, xsize=1, ysize=1,buf_type=gdal.GDT_Int16)
-    assert struct.unpack('H', data)[0] == 220
-
-    data = ds.GetRasterBand(1).GetOverview(1).ReadRaster(buf_xsize=1,buf_ysize=1, xsize=1, ysize=1,buf_type=gdal.GDT_Int16)
-    assert struct.unpack('H', data)[0] == 12
+    for subds, expected_cs, expected_val, expected_ovr_val in [
+            (sds[0][0], 35731, 220, 12),
+            (sds[1][0], 0, 0, 128)]:
+        ds = gdal.Open(subds)
+        assert ds.GetRasterBand(1).Checksum() == expected_cs
 
-    ds = gdal.Open('GTIFF_DIR:2:data/tiff_with_subifds.tif')
-    assert ds.GetRasterBand(1).Checksum() == 0
+        data = ds.GetRasterBand(1).ReadRaster(buf_xsize=1,buf_ysize=1, xsize=1, ysize=1,buf_type=gdal.GDT_Int16)
+        assert struct.unpack('H', data)[0] == expected_val
 
-    data = ds.GetRasterBand(1).ReadRaster(buf_xsize=1,buf_ysize=1, xsize=1, ysize=1,buf_type=gdal.GDT_Int16)
-    assert struct.unpack('H', data)[0] == 0
-
-    data = ds.GetRasterBand(1).GetOverview(1).ReadRaster(buf_xsize=1,buf_ysize=1, xsize=1, ysize=1,buf_type=gdal.GDT_Int16)
-    assert struct.unpack('H', data)[0] == 128
\ No newline at end of file
+        data = ds.GetRasterBand(1).GetOverview(1).ReadRaster(buf_xsize=1,buf_ysize=1, xsize=1, ysize=1,buf_type=gdal.GDT_Int16)
+        assert struct.unpack('H', data)[0] == expected_ovr_val
\ No newline at end of file
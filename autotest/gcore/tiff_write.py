@@ -7342,7 +7342,8 @@ def test_tiff_write_jpeg_incompatible_of_paletted():
 # Test blocksize overriding while creating (internal) overviews
 # on a newly created dataset
 
-@pytest.mark.parametrize("blockSize,numThreads", [[64, None], [256, 8]])
+@pytest.mark.parametrize("blockSize,numThreads", [[64, None], [256, 8]],
+                         ids=['blocksize64', 'blocksize256_8threads'])
 def test_tiff_write_internal_ovr_blocksize(blockSize, numThreads):
 
     src_ds = gdal.Open('../gdrivers/data/utm.tif')
@@ -7374,7 +7375,8 @@ def test_tiff_write_internal_ovr_blocksize(blockSize, numThreads):
 # Test blocksize propagation while creating (internal) overviews
 # on a newly created dataset
 
-@pytest.mark.parametrize("blockSize,numThreads", [[64, None], [256, 8]])
+@pytest.mark.parametrize("blockSize,numThreads", [[64, None], [256, 8]],
+                         ids=['blocksize64', 'blocksize256_8threads'])
 def test_tiff_write_internal_ovr_default_blocksize(blockSize, numThreads):
 
     src_ds = gdal.Open('../gdrivers/data/utm.tif')
@@ -7408,7 +7410,8 @@ def test_tiff_write_internal_ovr_default_blocksize(blockSize, numThreads):
 # Test LERC compression with Float32/Float64
 
 
-@pytest.mark.parametrize("gdalDataType,structType", [[gdal.GDT_Float32,'f'],[gdal.GDT_Float64,'d']])
+@pytest.mark.parametrize("gdalDataType,structType", [[gdal.GDT_Float32,'f'],[gdal.GDT_Float64,'d']],
+                         ids=['Float32', 'Float64'])
 def test_tiff_write_lerc_float(gdalDataType, structType):
 
     md = gdaltest.tiff_drv.GetMetadata()
@@ -7429,7 +7432,8 @@ def test_tiff_write_lerc_float(gdalDataType, structType):
 # Test LERC compression withFloat32/Float64 and nan
 
 
-@pytest.mark.parametrize("gdalDataType,structType", [[gdal.GDT_Float32,'f'],[gdal.GDT_Float64,'d']])
+@pytest.mark.parametrize("gdalDataType,structType", [[gdal.GDT_Float32,'f'],[gdal.GDT_Float64,'d']],
+                         ids=['Float32', 'Float64'])
 def test_tiff_write_lerc_float_with_nan(gdalDataType, structType):
 
     md = gdaltest.tiff_drv.GetMetadata()
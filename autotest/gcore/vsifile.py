@@ -179,7 +179,7 @@ def test_vsifile_4():
 def test_vsifile_5():
 
     fp = gdal.VSIFOpenL('tmp/vsifile_5.bin', 'wb')
-    ref_data = ''.join(['%08X' % i for i in range(5 * 32768)])
+    ref_data = '%08X' * (5 * 32768) % tuple(range(5 * 32768))
     gdal.VSIFWriteL(ref_data, 1, len(ref_data), fp)
     gdal.VSIFCloseL(fp)
 
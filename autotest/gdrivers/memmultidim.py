@@ -38,6 +38,17 @@ import pytest
 import struct
 
 
+# Cache of the 0, 1, 2, ... ramps used as reference data by many tests below,
+# so that they are not rebuilt element by element on each use.
+_ref_data_cache = {}
+
+def _ref_data(typecode, count):
+    key = (typecode, count)
+    if key not in _ref_data_cache:
+        _ref_data_cache[key] = array.array(typecode, range(count)).tobytes()
+    return _ref_data_cache[key]
+
+
 def test_mem_md_basic():
 
     drv = gdal.GetDriverByName('MEM')
@@ -487,7 +498,7 @@ def test_mem_md_array_3_dim():
     assert myarray.SetSpatialRef(sr) == gdal.CE_None
     assert myarray.GetSpatialRef() is not None
 
-    data = array.array('B', list(range(24))).tobytes()
+    data = _ref_data('B', 24)
     assert myarray.Write(data) == gdal.CE_None
 
     got_data = myarray.Read()
@@ -530,7 +541,7 @@ def test_mem_md_array_4_dim():
     assert myarray.GetDimensionCount() == 4
     assert myarray.GetTotalElementsCount() == 2 * 3 * 4 * 5
 
-    data = array.array('h', [-i for i in range(2 * 3 * 4 * 5)]).tobytes()
+    data = array.array('h', range(0, -(2 * 3 * 4 * 5), -1)).tobytes()
     assert myarray.Write(data) == gdal.CE_None
 
     got_data = myarray.Read()
@@ -552,8 +563,7 @@ def test_mem_md_copy_array():
     myarray = rg.CreateMDArray("myarray", [ dim0, dim1, dim2, dim3 ],
                                gdal.ExtendedDataType.Create(gdal.GDT_UInt32))
 
-    data = array.array('I',
-                       list(range(myarray.GetTotalElementsCount()))).tobytes()
+    data = _ref_data('I', myarray.GetTotalElementsCount())
     assert myarray.Write(data) == gdal.CE_None
 
     def my_cbk(pct, _, arg):
@@ -864,7 +874,7 @@ def test_mem_md_array_slice():
 
     ar = rg.CreateMDArray("array", [dim_2, dim_3, dim_4],
                           gdal.ExtendedDataType.Create(gdal.GDT_Byte))
-    data = array.array('B', list(range(24))).tobytes()
+    data = _ref_data('B', 24)
     assert ar.Write(data) == gdal.CE_None
 
     with pytest.raises(Exception):
@@ -1300,7 +1310,7 @@ def test_mem_md_array_transpose():
                               gdal.ExtendedDataType.Create(gdal.GDT_Float64))
     assert attr.Write(1) == gdal.CE_None
 
-    data = array.array('H', list(range(24))).tobytes()
+    data = _ref_data('H', 24)
     assert ar.Write(data) == gdal.CE_None
 
     with gdaltest.error_handler():
@@ -1385,7 +1395,7 @@ def test_mem_md_array_single_dim_non_contiguous_copy():
     drv = gdal.GetDriverByName('MEM')
     nvalues = 30
     spacing = 63
-    data = array.array('B', list(range(nvalues))).tobytes()
+    data = _ref_data('B', nvalues)
     for t in (gdal.GDT_Byte, gdal.GDT_Int16, gdal.GDT_Int32, gdal.GDT_Float64, gdal.GDT_CFloat64):
         ds = drv.CreateMultiDimensional('myds')
         rg = ds.GetRootGroup()
@@ -1560,7 +1570,7 @@ def test_mem_md_array_get_unscaled_3dim():
                                gdal.ExtendedDataType.Create(gdal.GDT_Byte))
     assert myarray
 
-    data = array.array('B', list(range(24))).tobytes()
+    data = _ref_data('B', 24)
     assert myarray.Write(data) == gdal.CE_None
 
     assert myarray.GetUnscaled().Read() == myarray.Read()
@@ -1579,10 +1589,10 @@ def test_mem_md_array_get_unscaled_3dim():
     assert unscaled.GetDataType().GetNumericDataType() == gdal.GDT_Float64
     expected_data = [x * 200.5 + 1.5 for x in range(24)]
     unscaled_data = unscaled.Read()
-    assert [x for x in struct.unpack('d' * 24, unscaled_data)] == expected_data
+    assert list(struct.unpack('d' * 24, unscaled_data)) == expected_data
     float32_dt = gdal.ExtendedDataType.Create(gdal.GDT_Float32)
     unscaled_data_float32 = unscaled.Read(buffer_datatype = float32_dt)
-    assert [x for x in struct.unpack('f' * 24, unscaled_data_float32)] == expected_data
+    assert list(struct.unpack('f' * 24, unscaled_data_float32)) == expected_data
 
     assert myarray.Write(b'\x00' * 24) == gdal.CE_None
     assert myarray.Read() != data
@@ -1600,7 +1610,7 @@ def test_mem_md_array_get_unscaled_3dim():
     unscaled = myarray.GetUnscaled()
     assert math.isnan(unscaled.GetNoDataValueAsDouble())
     unscaled_data_with_nan = unscaled.Read()
-    got_data = [x for x in struct.unpack('d' * 24, unscaled_data_with_nan)]
+    got_data = list(struct.unpack('d' * 24, unscaled_data_with_nan))
     expected_data = [float('nan') if x == 1 else x * 200.5 + 1.5 for x in struct.unpack('B' * 24, myarray.Read())]
     for i in range(24):
         if math.isnan(expected_data[i]):
@@ -1639,7 +1649,7 @@ def test_mem_md_array_get_unscaled_1dim_complex():
     unscaled = myarray.GetUnscaled()
     assert unscaled.GetDataType().GetNumericDataType() == gdal.GDT_CFloat64
     unscaled_data_with_nan = unscaled.Read()
-    got_data = [x for x in struct.unpack('d' * 4, unscaled_data_with_nan)]
+    got_data = list(struct.unpack('d' * 4, unscaled_data_with_nan))
     assert math.isnan(got_data[0])
     assert math.isnan(got_data[1])
     assert got_data[2] == 3 * 200.5 + 1.5
@@ -1679,7 +1689,7 @@ def test_mem_md_array_get_mask():
 
     myarray = rg.CreateMDArray("myarray", [ dim0, dim1, dim2 ],
                                gdal.ExtendedDataType.Create(gdal.GDT_Int32))
-    data = array.array('I', list(range(24))).tobytes()
+    data = _ref_data('i', 24)
     assert myarray.Write(data) == gdal.CE_None
 
     mask = myarray.GetMask()
@@ -1694,19 +1704,19 @@ def test_mem_md_array_get_mask():
     assert [x.GetSize() for x in mask.GetDimensions()] == [x.GetSize() for x in myarray.GetDimensions() ]
     assert mask.GetDataType().GetNumericDataType() == gdal.GDT_Byte
     # Case when we don't need to read the underlying array at all: the mask is always valid
-    assert [x for x in struct.unpack('B' * 24, mask.Read())] == [ 1 ] * 24
-    assert [x for x in struct.unpack('B' * 24, mask.Read(buffer_stride = [1, 2, 6]))] == [ 1 ] * 24
-    assert [x for x in struct.unpack('H' * 24, mask.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Int16)))] == [ 1 ] * 24
-    assert [x for x in struct.unpack('H' * 24, mask.Read(
-        buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Int16), buffer_stride = [1, 2, 6]))] == [ 1 ] * 24
+    assert list(struct.unpack('B' * 24, mask.Read())) == [ 1 ] * 24
+    assert list(struct.unpack('B' * 24, mask.Read(buffer_stride = [1, 2, 6]))) == [ 1 ] * 24
+    assert list(struct.unpack('H' * 24, mask.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Int16)))) == [ 1 ] * 24
+    assert list(struct.unpack('H' * 24, mask.Read(
+        buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Int16), buffer_stride = [1, 2, 6]))) == [ 1 ] * 24
 
     # Test no data value
     myarray.SetNoDataValueDouble(10)
     expected_data = [ 1 ] * 24
     expected_data[10] = 0
-    assert [x for x in struct.unpack('B' * 24, mask.Read())] == expected_data
-    assert [x for x in struct.unpack('B' * 24, mask.Read(buffer_stride = [1, 2, 6]))] == [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]
-    assert [x for x in struct.unpack('H' * 24, mask.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Int16)))] == expected_data
+    assert list(struct.unpack('B' * 24, mask.Read())) == expected_data
+    assert list(struct.unpack('B' * 24, mask.Read(buffer_stride = [1, 2, 6]))) == [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]
+    assert list(struct.unpack('H' * 24, mask.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Int16)))) == expected_data
 
     # Test missing_value, _FillValue, valid_min, valid_max
     bytedt = gdal.ExtendedDataType.Create(gdal.GDT_Byte)
@@ -1725,12 +1735,12 @@ def test_mem_md_array_get_mask():
     expected_data[9] = 0
     expected_data[10] = 0
     expected_data[23] = 0
-    assert [x for x in struct.unpack('B' * 24, mask.Read())] == expected_data
+    assert list(struct.unpack('B' * 24, mask.Read())) == expected_data
 
     # Test valid_range
     myarray = rg.CreateMDArray("myarray_valid_range", [ dim0, dim1, dim2 ],
                                gdal.ExtendedDataType.Create(gdal.GDT_Int16))
-    data = array.array('H', list(range(24))).tobytes()
+    data = _ref_data('h', 24)
     assert myarray.Write(data) == gdal.CE_None
     attr = myarray.CreateAttribute('valid_range', [2], bytedt)
     assert attr.Write([1,22]) == gdal.CE_None
@@ -1738,7 +1748,7 @@ def test_mem_md_array_get_mask():
     expected_data = [ 1 ] * 24
     expected_data[0] = 0
     expected_data[23] = 0
-    assert [x for x in struct.unpack('B' * 24, mask.Read())] == expected_data
+    assert list(struct.unpack('B' * 24, mask.Read())) == expected_data
 
     try:
         import numpy
@@ -1757,7 +1767,7 @@ def test_mem_md_array_get_mask():
     assert myarray.Write(struct.pack('f' * 2, 0, float('nan'))) == gdal.CE_None
 
     mask = myarray.GetMask()
-    assert [x for x in struct.unpack('B' * 2, mask.Read())] == [1, 0]
+    assert list(struct.unpack('B' * 2, mask.Read())) == [1, 0]
 
     # Test all data types
     for dt, v, nv, expected in [ (gdal.GDT_Byte, 1, 1,[1, 0]),
@@ -1776,7 +1786,7 @@ def test_mem_md_array_get_mask():
         assert myarray.Write(struct.pack('d' * 2, 0, v), buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Float64)) == gdal.CE_None
         myarray.SetNoDataValueDouble(nv)
         mask = myarray.GetMask()
-        assert [x for x in struct.unpack('B' * 2, mask.Read())] == expected, myarray.GetName()
+        assert list(struct.unpack('B' * 2, mask.Read())) == expected, myarray.GetName()
 
 
 def test_mem_md_array_resolvemdarray():
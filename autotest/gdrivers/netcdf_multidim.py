@@ -41,6 +41,31 @@ import sys
 
 pytestmark = pytest.mark.require_driver('netCDF')
 
+
+@pytest.fixture(scope='module')
+def alldatatypes_ds(netcdf_setup):  # noqa
+    # Several read-only tests exercise data/netcdf/alldatatypes.nc: open it
+    # only once for the whole module.
+    if not gdaltest.netcdf_drv_has_nc4:
+        pytest.skip()
+
+    ds = gdal.OpenEx('data/netcdf/alldatatypes.nc', gdal.OF_MULTIDIM_RASTER)
+    assert ds
+    return ds
+
+
+@pytest.fixture(scope='module')
+def byte_no_cf_mdim_src_ds(netcdf_setup):  # noqa
+    # Read-only multidim view of data/netcdf/byte_no_cf.nc shared by the
+    # CreateCopy() and AdviseRead tests below
+    if not gdaltest.netcdf_drv_has_nc4:
+        pytest.skip()
+
+    ds = gdal.OpenEx('data/netcdf/byte_no_cf.nc', gdal.OF_MULTIDIM_RASTER)
+    assert ds
+    return ds
+
+
 def test_netcdf_multidim_invalid_file(netcdf_setup):  # noqa
 
     if not gdaltest.netcdf_drv_has_nc4:
@@ -96,9 +121,8 @@ def test_netcdf_multidim_single_group(netcdf_setup):  # noqa
     assert var.GetProcessingChunkSize(0) == [1, 1]
 
     ref_ds = gdal.Open('data/netcdf/byte_no_cf.nc')
-    ref_data = struct.unpack('B' * 400, ref_ds.ReadRaster())
-    got_data = struct.unpack('B' * 400, var.Read())
-    assert got_data == ref_data
+    # Both buffers are raw Byte data: compare them directly
+    assert var.Read() == ref_ds.ReadRaster()
 
     with gdaltest.error_handler(): # Write to read only
         assert not rg.CreateDimension('X', None, None, 2)
@@ -185,14 +209,9 @@ def test_netcdf_multidim_from_ncdump(netcdf_setup):  # noqa
     assert rg
 
 
-def test_netcdf_multidim_var_alldatatypes(netcdf_setup):  # noqa
+def test_netcdf_multidim_var_alldatatypes(alldatatypes_ds):
 
-    if not gdaltest.netcdf_drv_has_nc4:
-        pytest.skip()
-
-    ds = gdal.OpenEx('data/netcdf/alldatatypes.nc', gdal.OF_MULTIDIM_RASTER)
-    assert ds
-    rg = ds.GetRootGroup()
+    rg = alldatatypes_ds.GetRootGroup()
     assert rg
 
     expected_vars = [ ('char_var', gdal.GDT_Byte, (ord('x'),ord('y'))),
@@ -241,22 +260,28 @@ def test_netcdf_multidim_var_alldatatypes(netcdf_setup):  # noqa
         if dt == gdal.GDT_CFloat64:
             assert struct.unpack('d' * len(val), var.Read()) == val
 
+    bytedt = gdal.ExtendedDataType.Create(gdal.GDT_Byte)
+    int16dt = gdal.ExtendedDataType.Create(gdal.GDT_Int16)
+    int32dt = gdal.ExtendedDataType.Create(gdal.GDT_Int32)
+    float32dt = gdal.ExtendedDataType.Create(gdal.GDT_Float32)
+    float64dt = gdal.ExtendedDataType.Create(gdal.GDT_Float64)
+
     # Read byte_var (where nc native type != gdal data type) to other data types
     var = rg.OpenMDArray('byte_var')
-    assert struct.unpack('B' * 2, var.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Byte))) == (0, 0)
-    assert struct.unpack('i' * 2, var.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Int32))) == (-128, -127)
+    assert struct.unpack('B' * 2, var.Read(buffer_datatype = bytedt)) == (0, 0)
+    assert struct.unpack('i' * 2, var.Read(buffer_datatype = int32dt)) == (-128, -127)
 
     # Read int_var to other data types
     var = rg.OpenMDArray('int_var')
-    assert struct.unpack('h' * 2, var.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Int16))) == (-32768, -32768)
-    assert struct.unpack('f' * 2, var.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Float32))) == (-2147483648.0, -2147483648.0)
-    assert struct.unpack('d' * 2, var.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Float64))) == (-2147483648.0, -2147483647.0)
+    assert struct.unpack('h' * 2, var.Read(buffer_datatype = int16dt)) == (-32768, -32768)
+    assert struct.unpack('f' * 2, var.Read(buffer_datatype = float32dt)) == (-2147483648.0, -2147483648.0)
+    assert struct.unpack('d' * 2, var.Read(buffer_datatype = float64dt)) == (-2147483648.0, -2147483647.0)
 
     # Read int64_var (where nc native type != gdal data type) to other data types
     var = rg.OpenMDArray('int64_var')
-    assert struct.unpack('h' * 2, var.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Int16))) == (-32768, -32768)
-    assert struct.unpack('f' * 2, var.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Float32))) == (-9.223372036854776e+18, -9.223372036854776e+18)
-    assert struct.unpack('d' * 2, var.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_Float64))) == (-9.223372036854776e+18, -9.223372036854776e+18)
+    assert struct.unpack('h' * 2, var.Read(buffer_datatype = int16dt)) == (-32768, -32768)
+    assert struct.unpack('f' * 2, var.Read(buffer_datatype = float32dt)) == (-9.223372036854776e+18, -9.223372036854776e+18)
+    assert struct.unpack('d' * 2, var.Read(buffer_datatype = float64dt)) == (-9.223372036854776e+18, -9.223372036854776e+18)
 
 
     var = rg.OpenMDArray('custom_type_2_elts_var')
@@ -313,10 +338,10 @@ def test_netcdf_multidim_var_alldatatypes(netcdf_setup):  # noqa
     assert dims[2].GetSize() == 3
 
     dims = rg.GetDimensions()
-    assert [dims[i].GetFullName() for i in range(len(dims))] == ['/Y', '/X', '/Y2', '/X2', '/Z2', '/T2']
+    assert [dim.GetFullName() for dim in dims] == ['/Y', '/X', '/Y2', '/X2', '/Z2', '/T2']
 
     dims = group.GetDimensions()
-    assert [dims[i].GetFullName() for i in range(len(dims))] == ['/group/Y', '/group/X']
+    assert [dim.GetFullName() for dim in dims] == ['/group/Y', '/group/X']
 
 
 def test_netcdf_multidim_2d_dim_char_variable(netcdf_setup):  # noqa
@@ -342,19 +367,16 @@ def test_netcdf_multidim_2d_dim_char_variable(netcdf_setup):  # noqa
     assert indexing_var.GetName() == 'TIME'
 
 
-def test_netcdf_multidim_read_array(netcdf_setup):  # noqa
+def test_netcdf_multidim_read_array(alldatatypes_ds):
 
-    if not gdaltest.netcdf_drv_has_nc4:
-        pytest.skip()
-
-    ds = gdal.OpenEx('data/netcdf/alldatatypes.nc', gdal.OF_MULTIDIM_RASTER)
-    rg = ds.GetRootGroup()
+    rg = alldatatypes_ds.GetRootGroup()
+    uint16dt = gdal.ExtendedDataType.Create(gdal.GDT_UInt16)
 
     # 0D
     var = rg.OpenMDArray('ubyte_no_dim_var')
     assert var
     assert struct.unpack('B', var.Read()) == (2,)
-    assert struct.unpack('H', var.Read(buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_UInt16))) == (2,)
+    assert struct.unpack('H', var.Read(buffer_datatype = uint16dt)) == (2,)
 
     # 1D
     var = rg.OpenMDArray('ubyte_x2_var')
@@ -363,7 +385,7 @@ def test_netcdf_multidim_read_array(netcdf_setup):  # noqa
     assert struct.unpack('B' * len(data), data) == got_data_ref
 
     data = var.Read(array_start_idx = [1], count = [2], array_step = [2],
-                    buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_UInt16))
+                    buffer_datatype = uint16dt)
     assert struct.unpack('H' * (len(data) // 2), data) == got_data_ref
 
     data = var.Read(array_start_idx = [2], count = [2], array_step = [-2])
@@ -376,14 +398,14 @@ def test_netcdf_multidim_read_array(netcdf_setup):  # noqa
     got_data_ref = (1, 2, 3, 9, 10, 11)
     assert struct.unpack('B' * len(data), data) == got_data_ref
 
-    data = var.Read(count = [2, 3], array_step = [2, 1], buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_UInt16))
+    data = var.Read(count = [2, 3], array_step = [2, 1], buffer_datatype = uint16dt)
     assert struct.unpack('H' * (len(data) // 2), data) == got_data_ref
 
     data = var.Read(array_start_idx = [1, 2], count = [2, 2])
     got_data_ref = (7, 8, 11, 12)
     assert struct.unpack('B' * len(data), data) == got_data_ref
 
-    data = var.Read(array_start_idx = [1, 2], count = [2, 2], buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_UInt16))
+    data = var.Read(array_start_idx = [1, 2], count = [2, 2], buffer_datatype = uint16dt)
     assert struct.unpack('H' * (len(data) // 2), data) == got_data_ref
 
     # 3D
@@ -392,14 +414,14 @@ def test_netcdf_multidim_read_array(netcdf_setup):  # noqa
     got_data_ref = (1, 2, 3, 9, 10, 11, 2, 3, 4, 10, 11, 12, 3, 4, 5, 11, 12, 1)
     assert struct.unpack('B' * len(data), data) == got_data_ref
 
-    data = var.Read(count = [3, 2, 3], array_step = [1, 2, 1], buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_UInt16))
+    data = var.Read(count = [3, 2, 3], array_step = [1, 2, 1], buffer_datatype = uint16dt)
     assert struct.unpack('H' * (len(data) // 2), data) == got_data_ref
 
     data = var.Read(array_start_idx = [1, 1, 1], count = [3, 2, 2])
     got_data_ref = (7, 8, 11, 12, 8, 9, 12, 1, 9, 10, 1, 2)
     assert struct.unpack('B' * len(data), data) == got_data_ref
 
-    data = var.Read(array_start_idx = [1, 1, 1], count = [3, 2, 2], buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_UInt16))
+    data = var.Read(array_start_idx = [1, 1, 1], count = [3, 2, 2], buffer_datatype = uint16dt)
     assert struct.unpack('H' * (len(data) // 2), data) == got_data_ref
 
     # Test reading from slice (most optimized path)
@@ -418,17 +440,13 @@ def test_netcdf_multidim_read_array(netcdf_setup):  # noqa
     got_data_ref = (1, 2, 3, 9, 10, 11, 2, 3, 4, 10, 11, 12, 3, 4, 5, 11, 12, 1, 2, 3, 4, 10, 11, 12, 3, 4, 5, 11, 12, 1, 4, 5, 6, 12, 1, 2)
     assert struct.unpack('B' * len(data), data) == got_data_ref
 
-    data = var.Read(count = [2, 3, 2, 3], array_step = [1, 1, 2, 1], buffer_datatype = gdal.ExtendedDataType.Create(gdal.GDT_UInt16))
+    data = var.Read(count = [2, 3, 2, 3], array_step = [1, 1, 2, 1], buffer_datatype = uint16dt)
     assert struct.unpack('H' * (len(data) // 2), data) ==  got_data_ref
 
 
-def test_netcdf_multidim_attr_alldatatypes(netcdf_setup):  # noqa
+def test_netcdf_multidim_attr_alldatatypes(alldatatypes_ds):
 
-    if not gdaltest.netcdf_drv_has_nc4:
-        pytest.skip()
-
-    ds = gdal.OpenEx('data/netcdf/alldatatypes.nc', gdal.OF_MULTIDIM_RASTER)
-    rg = ds.GetRootGroup()
+    rg = alldatatypes_ds.GetRootGroup()
 
     attrs = rg.GetAttributes()
     assert len(attrs) == 1
@@ -1466,48 +1484,45 @@ def test_netcdf_multidim_stats(netcdf_setup):  # noqa
         drv.Delete(tmpfilename)
 
 
-def test_netcdf_multidim_advise_read(netcdf_setup):  # noqa
+def test_netcdf_multidim_advise_read(byte_no_cf_mdim_src_ds):
 
-    if not gdaltest.netcdf_drv_has_nc4:
-        pytest.skip()
-
-    ds = gdal.OpenEx('data/netcdf/byte_no_cf.nc', gdal.OF_MULTIDIM_RASTER)
-    rg = ds.GetRootGroup()
+    rg = byte_no_cf_mdim_src_ds.GetRootGroup()
     var = rg.OpenMDArray('Band1')
-    ref_data_whole = struct.unpack('B' * 20 * 20, var.Read())
-    ref_data = struct.unpack('B' * 4 * 5, var.Read(array_start_idx = [2, 3], count = [4, 5]))
+    ref_data_whole = var.Read()
+    # Derive the expected sub-window, line and transposed views from the
+    # whole-array read rather than issuing extra Read() calls. As everything
+    # is raw GDT_Byte data, keep the reference buffers as bytes so that the
+    # assertions below are plain memory comparisons.
+    ref_data = bytes(ref_data_whole[(2 + j) * 20 + 3 + i]
+                     for j in range(4) for i in range(5))
 
     sliced = var[1]
-    ref_data_line = struct.unpack('B' * 20, sliced.Read())
+    ref_data_line = ref_data_whole[20:40]
 
     transposed = var.Transpose([1, 0])
-    ref_data_transposed = struct.unpack('B' * 20 * 20, transposed.Read())
+    ref_data_transposed = bytes(ref_data_whole[j * 20 + i]
+                                for i in range(20) for j in range(20))
 
     # AdviseRead on all
     assert var.AdviseRead() == gdal.CE_None
 
     # Can use AdviseRead
-    got_data = struct.unpack('B' * 4 * 5, var.Read(array_start_idx = [2, 3], count = [4, 5]))
-    assert got_data == ref_data
+    assert var.Read(array_start_idx = [2, 3], count = [4, 5]) == ref_data
 
     # AdviseRead on portion
     assert var.AdviseRead(array_start_idx = [2, 3], count = [4, 5]) == gdal.CE_None
-    got_data = struct.unpack('B' * 4 * 5, var.Read(array_start_idx = [2, 3], count = [4, 5]))
-    assert got_data == ref_data
+    assert var.Read(array_start_idx = [2, 3], count = [4, 5]) == ref_data
 
     # Cannot use AdviseRead as we read outside of it
-    got_data = struct.unpack('B' * 20 * 20, var.Read())
-    assert got_data == ref_data_whole
+    assert var.Read() == ref_data_whole
 
     # On a slice
     assert sliced.AdviseRead() == gdal.CE_None
-    got_data = struct.unpack('B' * 20, sliced.Read())
-    assert got_data == ref_data_line
+    assert sliced.Read() == ref_data_line
 
     # On transposed array
     assert transposed.AdviseRead() == gdal.CE_None
-    got_data = struct.unpack('B' * 20 * 20, transposed.Read())
-    assert got_data == ref_data_transposed
+    assert transposed.Read() == ref_data_transposed
 
     with gdaltest.error_handler():
         assert var.AdviseRead(array_start_idx = [2, 3], count = [20, 5]) == gdal.CE_Failure
@@ -1548,12 +1563,9 @@ def test_netcdf_multidim_get_mask(netcdf_setup):  # noqa
         drv.Delete(tmpfilename)
 
 
-def test_netcdf_multidim_createcopy_array_options(netcdf_setup):  # noqa
-
-    if not gdaltest.netcdf_drv_has_nc4:
-        pytest.skip()
+def test_netcdf_multidim_createcopy_array_options(byte_no_cf_mdim_src_ds):
 
-    src_ds = gdal.OpenEx('data/netcdf/byte_no_cf.nc', gdal.OF_MULTIDIM_RASTER)
+    src_ds = byte_no_cf_mdim_src_ds
     tmpfilename = 'tmp/test_netcdf_multidim_createcopy_array_options.nc'
     with gdaltest.error_handler():
         gdal.GetDriverByName('netCDF').CreateCopy(tmpfilename, src_ds,
@@ -1573,12 +1585,9 @@ def test_netcdf_multidim_createcopy_array_options(netcdf_setup):  # noqa
     gdal.Unlink(tmpfilename)
 
 
-def test_netcdf_multidim_createcopy_array_options_if_name_fullname(netcdf_setup):  # noqa
-
-    if not gdaltest.netcdf_drv_has_nc4:
-        pytest.skip()
+def test_netcdf_multidim_createcopy_array_options_if_name_fullname(byte_no_cf_mdim_src_ds):
 
-    src_ds = gdal.OpenEx('data/netcdf/byte_no_cf.nc', gdal.OF_MULTIDIM_RASTER)
+    src_ds = byte_no_cf_mdim_src_ds
     tmpfilename = 'tmp/test_netcdf_multidim_createcopy_array_options_if_name_fullname.nc'
     with gdaltest.error_handler():
         gdal.GetDriverByName('netCDF').CreateCopy(tmpfilename, src_ds,
@@ -32,9 +32,18 @@ from osgeo import gdal
 from osgeo import osr
 import gdaltest
 import math
+import pytest
 import struct
 
 
+@pytest.fixture()
+def tmpfile(request):
+    # Unique /vsimem filename, removed on teardown even if the test fails
+    filename = '/vsimem/' + request.node.name + '.vrt'
+    yield filename
+    gdal.Unlink(filename)
+
+
 def test_vrtmultidim_dimension():
 
     ds = gdal.OpenEx("""<VRTDataset>
@@ -944,6 +953,8 @@ def test_vrtmultidim_Source_classic_dataset():
         assert not ar_wrong_band.Read()
 
 
+_validate_schema = None
+
 def _validate(content):
 
     try:
@@ -952,18 +963,19 @@ def _validate(content):
         return
 
     doc = etree.XML(content)
-    try:
-        schema_content = open('../../gdal/data/gdalvrt.xsd', 'rb').read()
-    except IOError:
-        print('Cannot read gdalvrt.xsd schema')
-        return
-    schema = etree.XMLSchema(etree.XML(schema_content))
-    schema.assertValid(doc)
+    global _validate_schema
+    if _validate_schema is None:
+        try:
+            schema_content = open('../../gdal/data/gdalvrt.xsd', 'rb').read()
+        except IOError:
+            print('Cannot read gdalvrt.xsd schema')
+            return
+        _validate_schema = etree.XMLSchema(etree.XML(schema_content))
+    _validate_schema.assertValid(doc)
 
 
-def test_vrtmultidim_serialize():
+def test_vrtmultidim_serialize(tmpfile):
 
-    tmpfile = '/vsimem/test.vrt'
     gdal.FileFromMemBuffer(tmpfile, """<VRTDataset>
     <Group name="/">
         <Dimension name="Y" size="4" indexingVariable="Y"/>
@@ -1106,10 +1118,8 @@ def test_vrtmultidim_serialize():
 
     _validate(got_data)
 
-    gdal.Unlink(tmpfile)
-
 
-def test_vrtmultidim_createcopy():
+def test_vrtmultidim_createcopy(tmpfile):
 
     src_ds = gdal.GetDriverByName('MEM').CreateMultiDimensional('myds')
     src_rg = src_ds.GetRootGroup()
@@ -1131,7 +1141,6 @@ def test_vrtmultidim_createcopy():
     with gdaltest.error_handler():
         gdal.GetDriverByName('VRT').CreateCopy('/i_do/not_exist', src_ds)
 
-    tmpfile = '/vsimem/test.vrt'
     assert gdal.GetDriverByName('VRT').CreateCopy(tmpfile, src_ds)
 
     f = gdal.VSIFOpenL(tmpfile, 'rb')
@@ -1162,12 +1171,9 @@ def test_vrtmultidim_createcopy():
 
     _validate(got_data)
 
-    gdal.Unlink(tmpfile)
 
+def test_vrtmultidim_createmultidimensional(tmpfile):
 
-def test_vrtmultidim_createmultidimensional():
-
-    tmpfile = '/vsimem/test.vrt'
     ds = gdal.GetDriverByName('VRT').CreateMultiDimensional(tmpfile)
     rg = ds.GetRootGroup()
 
@@ -1230,5 +1236,3 @@ def test_vrtmultidim_createmultidimensional():
 </VRTDataset>
 """
     _validate(got_data)
-
-    gdal.Unlink(tmpfile)
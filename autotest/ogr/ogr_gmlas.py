@@ -33,8 +33,10 @@
 ###############################################################################
 
 from http.server import BaseHTTPRequestHandler
+import difflib
 import os
 import os.path
+import sys
 
 
 import gdaltest
@@ -70,6 +72,20 @@ def startup_and_cleanup():
 
 ###############################################################################
 
+# Cache of the expected ogrinfo output files, which are re-used by several
+# tests
+_ref_files_cache = {}
+
+def _ref_file_content(reffile):
+    # Returns the expected text, already normalized, together with its
+    # pre-split lines for difflib
+    if reffile not in _ref_files_cache:
+        text = open(reffile, 'rb').read().replace(b'\r\n', b'\n').decode('utf-8')
+        _ref_files_cache[reffile] = (text, text.splitlines(keepends=True))
+    return _ref_files_cache[reffile]
+
+###############################################################################
+
 def compare_ogrinfo_output(gmlfile, reffile, options=''):
 
     import test_cli_utilities
@@ -77,7 +93,6 @@ def compare_ogrinfo_output(gmlfile, reffile, options=''):
     if test_cli_utilities.get_ogrinfo_path() is None:
         pytest.skip()
 
-    tmpfilename = 'tmp/' + os.path.basename(gmlfile) + '.txt'
     ret = gdaltest.runexternal(test_cli_utilities.get_ogrinfo_path() +
                                ' -ro -al GMLAS:' + gmlfile +
                                ' -oo EXPOSE_METADATA_LAYERS=YES ' +
@@ -87,30 +102,29 @@ def compare_ogrinfo_output(gmlfile, reffile, options=''):
                                encoding='utf-8')
     ret = ret.replace('\r\n', '\n')
     ret = ret.replace('data\\gmlas\\', 'data/gmlas/')  # Windows
-    expected = open(reffile, 'rb').read().decode('utf-8')
-    expected = expected.replace('\r\n', '\n')
+    expected, expected_lines = _ref_file_content(reffile)
     if ret != expected:
         print(ret.encode('utf-8'))
-        open(tmpfilename, 'wb').write(ret.encode('utf-8'))
         print('Diff:')
-        os.system('diff -u ' + reffile + ' ' + tmpfilename)
-        # os.unlink(tmpfilename)
+        sys.stdout.writelines(difflib.unified_diff(expected_lines,
+                                                   ret.splitlines(keepends=True),
+                                                   reffile, 'got'))
         pytest.fail('Got:')
-    
+
 ###############################################################################
 # Basic test
 
 
 def test_ogr_gmlas_basic():
 
-    ds = ogr.Open('GMLAS:data/gmlas/gmlas_test1.xml')
-    assert ds is not None
-    ds = None
-
     # Skip tests when -fsanitize is used
     if gdaltest.is_travis_branch('sanitize'):
         pytest.skip('Skipping because of -sanitize')
 
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR)
+    assert ds is not None
+    ds = None
+
     return compare_ogrinfo_output('data/gmlas/gmlas_test1.xml',
                                   'data/gmlas/gmlas_test1.txt')
 
@@ -139,24 +153,20 @@ def test_ogr_gmlas_test_ogrsf():
 
 def test_ogr_gmlas_virtual_file():
 
-    gdal.FileFromMemBuffer('/vsimem/ogr_gmlas_8.xml',
+    with gdaltest.tempfile('/vsimem/ogr_gmlas_8.xml',
                            """<myns:main_elt xmlns:myns="http://myns"
                   xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-                  xsi:schemaLocation="http://myns ogr_gmlas_8.xsd"/>""")
-
-    gdal.FileFromMemBuffer('/vsimem/ogr_gmlas_8.xsd',
+                  xsi:schemaLocation="http://myns ogr_gmlas_8.xsd"/>"""), \
+         gdaltest.tempfile('/vsimem/ogr_gmlas_8.xsd',
                            """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
            xmlns:myns="http://myns"
            targetNamespace="http://myns"
            elementFormDefault="qualified" attributeFormDefault="unqualified">
 <xs:element name="main_elt" type="xs:string"/>
-</xs:schema>""")
+</xs:schema>"""):
 
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_8.xml')
-    assert ds is not None
-
-    gdal.Unlink('/vsimem/ogr_gmlas_8.xml')
-    gdal.Unlink('/vsimem/ogr_gmlas_8.xsd')
+        ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_8.xml', gdal.OF_VECTOR)
+        assert ds is not None
 
 ###############################################################################
 # Test opening with XSD option
@@ -164,7 +174,7 @@ def test_ogr_gmlas_virtual_file():
 
 def test_ogr_gmlas_datafile_with_xsd_option():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=['XSD=data/gmlas/gmlas_test1.xsd'])
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_test1.xsd'])
     assert ds is not None
 
 ###############################################################################
@@ -173,7 +183,7 @@ def test_ogr_gmlas_datafile_with_xsd_option():
 
 def test_ogr_gmlas_no_datafile_with_xsd_option():
 
-    ds = gdal.OpenEx('GMLAS:', open_options=['XSD=data/gmlas/gmlas_test1.xsd'])
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_test1.xsd'])
     assert ds is not None
 
 ###############################################################################
@@ -183,9 +193,9 @@ def test_ogr_gmlas_no_datafile_with_xsd_option():
 def test_ogr_gmlas_no_datafile_xsd_which_is_not_xsd():
 
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:', open_options=['XSD=data/gmlas/gmlas_test1.xml'])
+        ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_test1.xml'])
     assert ds is None
-    assert gdal.GetLastErrorMsg().find("invalid content in 'schema' element") >= 0
+    assert "invalid content in 'schema' element" in gdal.GetLastErrorMsg()
 
 ###############################################################################
 # Test opening with nothing
@@ -194,9 +204,9 @@ def test_ogr_gmlas_no_datafile_xsd_which_is_not_xsd():
 def test_ogr_gmlas_no_datafile_no_xsd():
 
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:')
+        ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR)
     assert ds is None
-    assert gdal.GetLastErrorMsg().find('XSD open option must be provided when no XML data file is passed') >= 0
+    assert 'XSD open option must be provided when no XML data file is passed' in gdal.GetLastErrorMsg()
 
 ###############################################################################
 # Test opening an inexisting GML file
@@ -205,9 +215,10 @@ def test_ogr_gmlas_no_datafile_no_xsd():
 def test_ogr_gmlas_non_existing_gml():
 
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:/vsimem/i_do_not_exist.gml')
+        ds = gdal.OpenEx('GMLAS:/vsimem/i_do_not_exist.gml', gdal.OF_VECTOR)
     assert ds is None
-    assert gdal.GetLastErrorMsg().find('Cannot open /vsimem/i_do_not_exist.gml') >= 0
+    assert gdal.GetLastErrorNo() == gdal.CPLE_FileIO
+    assert '/vsimem/i_do_not_exist.gml' in gdal.GetLastErrorMsg()
 
 ###############################################################################
 # Test opening with just XSD option but pointing to a non existing file
@@ -216,9 +227,10 @@ def test_ogr_gmlas_non_existing_gml():
 def test_ogr_gmlas_non_existing_xsd():
 
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:', open_options=['XSD=/vsimem/i_do_not_exist.xsd'])
+        ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=/vsimem/i_do_not_exist.xsd'])
     assert ds is None
-    assert gdal.GetLastErrorMsg().find('Cannot resolve /vsimem/i_do_not_exist.xsd') >= 0
+    assert gdal.GetLastErrorNo() == gdal.CPLE_FileIO
+    assert '/vsimem/i_do_not_exist.xsd' in gdal.GetLastErrorMsg()
 
 ###############################################################################
 # Test opening a GML file without schemaLocation
@@ -226,15 +238,12 @@ def test_ogr_gmlas_non_existing_xsd():
 
 def test_ogr_gmlas_gml_without_schema_location():
 
-    gdal.FileFromMemBuffer('/vsimem/ogr_gmlas_gml_without_schema_location.xml',
-                           """<MYNS:main_elt xmlns:MYNS="http://myns"/>""")
-
-    with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_gml_without_schema_location.xml')
+    with gdaltest.tempfile('/vsimem/ogr_gmlas_gml_without_schema_location.xml',
+                           """<MYNS:main_elt xmlns:MYNS="http://myns"/>"""):
+        with gdaltest.error_handler():
+            ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_gml_without_schema_location.xml', gdal.OF_VECTOR)
     assert ds is None
-    assert gdal.GetLastErrorMsg().find('No schema locations found when analyzing data file: XSD open option must be provided') >= 0
-
-    gdal.Unlink('/vsimem/ogr_gmlas_gml_without_schema_location.xml')
+    assert 'No schema locations found when analyzing data file: XSD open option must be provided' in gdal.GetLastErrorMsg()
 
 ###############################################################################
 # Test invalid schema
@@ -243,9 +252,9 @@ def test_ogr_gmlas_gml_without_schema_location():
 def test_ogr_gmlas_invalid_schema():
 
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_invalid_schema.xml')
+        ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_invalid_schema.xml', gdal.OF_VECTOR)
     assert ds is None
-    assert gdal.GetLastErrorMsg().find('invalid content') >= 0
+    assert 'invalid content' in gdal.GetLastErrorMsg()
 
 ###############################################################################
 # Test invalid XML
@@ -253,12 +262,12 @@ def test_ogr_gmlas_invalid_schema():
 
 def test_ogr_gmlas_invalid_xml():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_invalid_xml.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_invalid_xml.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayer(0)
     with gdaltest.error_handler():
         f = lyr.GetNextFeature()
     assert f is None
-    assert gdal.GetLastErrorMsg().find('input ended before all started tags were ended') >= 0
+    assert 'input ended before all started tags were ended' in gdal.GetLastErrorMsg()
 
 ###############################################################################
 # Test links with gml:ReferenceType
@@ -266,7 +275,7 @@ def test_ogr_gmlas_invalid_xml():
 
 def test_ogr_gmlas_gml_Reference():
 
-    ds = ogr.Open('GMLAS:data/gmlas/gmlas_test_targetelement.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test_targetelement.xml', gdal.OF_VECTOR)
     assert ds.GetLayerCount() == 3
 
     lyr = ds.GetLayerByName('main_elt')
@@ -289,7 +298,7 @@ def test_ogr_gmlas_gml_Reference():
 
 def test_ogr_gmlas_same_element_in_different_ns():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_same_element_in_different_ns.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_same_element_in_different_ns.xml', gdal.OF_VECTOR)
     assert ds is not None
     # for i in range(ds.GetLayerCount()):
     #    print(ds.GetLayer(i).GetName())
@@ -311,41 +320,27 @@ def test_ogr_gmlas_same_element_in_different_ns():
 
 def test_ogr_gmlas_corner_case_relative_path():
 
-    ds = ogr.Open('GMLAS:../ogr/data/gmlas/gmlas_test1.xml')
+    ds = gdal.OpenEx('GMLAS:../ogr/data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR)
     assert ds is not None
 
 ###############################################################################
 # Test unexpected repeated element
 
 
-def test_ogr_gmlas_unexpected_repeated_element():
-
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_unexpected_repeated_element.xml')
-    lyr = ds.GetLayer(0)
-    with gdaltest.error_handler():
-        f = lyr.GetNextFeature()
-    if f is None or f['foo'] != 'foo_again':  # somewhat arbitrary to keep the latest one!
-        f.DumpReadable()
-        pytest.fail()
-    assert gdal.GetLastErrorMsg().find('Unexpected element myns:main_elt/myns:foo') >= 0
-    f = lyr.GetNextFeature()
-    assert f is None
-    ds = None
-
-###############################################################################
-# Test unexpected repeated element
-
-
-def test_ogr_gmlas_unexpected_repeated_element_variant():
+@pytest.mark.parametrize('xmlfile',
+                         ['data/gmlas/gmlas_unexpected_repeated_element.xml',
+                          'data/gmlas/gmlas_unexpected_repeated_element_variant.xml'],
+                         ids=['base', 'variant'])
+def test_ogr_gmlas_unexpected_repeated_element(xmlfile):
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_unexpected_repeated_element_variant.xml')
+    ds = gdal.OpenEx('GMLAS:' + xmlfile, gdal.OF_VECTOR)
     lyr = ds.GetLayer(0)
     with gdaltest.error_handler():
         f = lyr.GetNextFeature()
     if f is None or f['foo'] != 'foo_again':  # somewhat arbitrary to keep the latest one!
         f.DumpReadable()
         pytest.fail()
-    assert gdal.GetLastErrorMsg().find('Unexpected element myns:main_elt/myns:foo') >= 0
+    assert 'Unexpected element myns:main_elt/myns:foo' in gdal.GetLastErrorMsg()
     f = lyr.GetNextFeature()
     assert f is None
     ds = None
@@ -356,11 +351,12 @@ def test_ogr_gmlas_unexpected_repeated_element_variant():
 
 def test_ogr_gmlas_geometryproperty():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32.gml', open_options=[
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32.gml', gdal.OF_VECTOR, open_options=[
         'CONFIG_FILE=<Configuration><LayerBuildingRules><GML><IncludeGeometryXML>true</IncludeGeometryXML></GML></LayerBuildingRules></Configuration>'])
     lyr = ds.GetLayer(0)
+    lyr_defn = lyr.GetLayerDefn()
     with gdaltest.error_handler():
-        geom_field_count = lyr.GetLayerDefn().GetGeomFieldCount()
+        geom_field_count = lyr_defn.GetGeomFieldCount()
     assert geom_field_count == 15
     f = lyr.GetNextFeature()
     if f['geometryProperty_xml'] != ' <gml:Point gml:id="poly.geom.Geometry" srsName="urn:ogc:def:crs:EPSG::4326"> <gml:pos>49 2</gml:pos> </gml:Point> ':
@@ -378,40 +374,40 @@ def test_ogr_gmlas_geometryproperty():
             '<gml:Point gml:id="poly.geom.pointPropertyRepeated.3"><gml:pos>3 4</gml:pos></gml:Point>']:
         f.DumpReadable()
         pytest.fail(f['pointPropertyRepeated_xml'])
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('geometryProperty')
-    sr = lyr.GetLayerDefn().GetGeomFieldDefn(geom_idx).GetSpatialRef()
+    geom_idx = lyr_defn.GetGeomFieldIndex('geometryProperty')
+    sr = lyr_defn.GetGeomFieldDefn(geom_idx).GetSpatialRef()
     assert not (sr is None or sr.ExportToWkt().find('4326') < 0)
     wkt = f.GetGeomFieldRef(geom_idx).ExportToWkt()
     # Axis swapping
     if wkt != 'POINT (2 49)':
         f.DumpReadable()
         pytest.fail()
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('geometryPropertyEmpty')
+    geom_idx = lyr_defn.GetGeomFieldIndex('geometryPropertyEmpty')
     if f.GetGeomFieldRef(geom_idx) is not None:
         f.DumpReadable()
         pytest.fail()
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('pointProperty')
-    sr = lyr.GetLayerDefn().GetGeomFieldDefn(geom_idx).GetSpatialRef()
+    geom_idx = lyr_defn.GetGeomFieldIndex('pointProperty')
+    sr = lyr_defn.GetGeomFieldDefn(geom_idx).GetSpatialRef()
     assert not (sr is None or sr.ExportToWkt().find('4326') < 0)
     wkt = f.GetGeomFieldRef(geom_idx).ExportToWkt()
     if wkt != 'POINT (3 50)':
         f.DumpReadable()
         pytest.fail()
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('lineStringProperty')
-    sr = lyr.GetLayerDefn().GetGeomFieldDefn(geom_idx).GetSpatialRef()
+    geom_idx = lyr_defn.GetGeomFieldIndex('lineStringProperty')
+    sr = lyr_defn.GetGeomFieldDefn(geom_idx).GetSpatialRef()
     assert not (sr is None or sr.ExportToWkt().find('4326') < 0)
-    assert lyr.GetLayerDefn().GetGeomFieldDefn(geom_idx).GetType() == ogr.wkbLineString
+    assert lyr_defn.GetGeomFieldDefn(geom_idx).GetType() == ogr.wkbLineString
     wkt = f.GetGeomFieldRef(geom_idx).ExportToWkt()
     if wkt != 'LINESTRING (2 49)':
         f.DumpReadable()
         pytest.fail()
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('pointPropertyRepeated')
-    assert lyr.GetLayerDefn().GetGeomFieldDefn(geom_idx).GetType() == ogr.wkbUnknown
+    geom_idx = lyr_defn.GetGeomFieldIndex('pointPropertyRepeated')
+    assert lyr_defn.GetGeomFieldDefn(geom_idx).GetType() == ogr.wkbUnknown
     wkt = f.GetGeomFieldRef(geom_idx).ExportToWkt()
     if wkt != 'GEOMETRYCOLLECTION (POINT (0 1),POINT (1 2),POINT (3 4))':
         f.DumpReadable()
         pytest.fail()
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('mycustompointproperty_point')
+    geom_idx = lyr_defn.GetGeomFieldIndex('mycustompointproperty_point')
     wkt = f.GetGeomFieldRef(geom_idx).ExportToWkt()
     if wkt != 'POINT (5 6)':
         f.DumpReadable()
@@ -419,7 +415,7 @@ def test_ogr_gmlas_geometryproperty():
 
     # Test that on-the-fly reprojection works
     f = lyr.GetNextFeature()
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('geometryProperty')
+    geom_idx = lyr_defn.GetGeomFieldIndex('geometryProperty')
     geom = f.GetGeomFieldRef(geom_idx)
     if ogrtest.check_feature_geometry(geom, 'POINT (3.0 0.0)') != 0:
         f.DumpReadable()
@@ -428,24 +424,25 @@ def test_ogr_gmlas_geometryproperty():
     # Failed reprojection
     with gdaltest.error_handler():
         f = lyr.GetNextFeature()
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('geometryProperty')
+    geom_idx = lyr_defn.GetGeomFieldIndex('geometryProperty')
     if f.GetGeomFieldRef(geom_idx) is not None:
         f.DumpReadable()
         pytest.fail()
 
     # Test SWAP_COORDINATES=NO
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32.gml',
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32.gml', gdal.OF_VECTOR,
                      open_options=['SWAP_COORDINATES=NO'])
     lyr = ds.GetLayer(0)
+    lyr_defn = lyr.GetLayerDefn()
     with gdaltest.error_handler():
         f = lyr.GetNextFeature()
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('geometryProperty')
+    geom_idx = lyr_defn.GetGeomFieldIndex('geometryProperty')
     wkt = f.GetGeomFieldRef(geom_idx).ExportToWkt()
     # Axis swapping
     if wkt != 'POINT (49 2)':
         f.DumpReadable()
         pytest.fail()
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('lineStringProperty')
+    geom_idx = lyr_defn.GetGeomFieldIndex('lineStringProperty')
     wkt = f.GetGeomFieldRef(geom_idx).ExportToWkt()
     # Axis swapping
     if wkt != 'LINESTRING (2 49)':
@@ -453,18 +450,19 @@ def test_ogr_gmlas_geometryproperty():
         pytest.fail()
 
     # Test SWAP_COORDINATES=YES
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32.gml',
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32.gml', gdal.OF_VECTOR,
                      open_options=['SWAP_COORDINATES=YES'])
     lyr = ds.GetLayer(0)
+    lyr_defn = lyr.GetLayerDefn()
     with gdaltest.error_handler():
         f = lyr.GetNextFeature()
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('geometryProperty')
+    geom_idx = lyr_defn.GetGeomFieldIndex('geometryProperty')
     wkt = f.GetGeomFieldRef(geom_idx).ExportToWkt()
     # Axis swapping
     if wkt != 'POINT (2 49)':
         f.DumpReadable()
         pytest.fail()
-    geom_idx = lyr.GetLayerDefn().GetGeomFieldIndex('lineStringProperty')
+    geom_idx = lyr_defn.GetGeomFieldIndex('lineStringProperty')
     wkt = f.GetGeomFieldRef(geom_idx).ExportToWkt()
     # Axis swapping
     if wkt != 'LINESTRING (49 2)':
@@ -478,7 +476,7 @@ def test_ogr_gmlas_geometryproperty():
 
 def test_ogr_gmlas_abstractgeometry():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_abstractgeometry_gml32.gml', open_options=[
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_abstractgeometry_gml32.gml', gdal.OF_VECTOR, open_options=[
         'CONFIG_FILE=<Configuration><LayerBuildingRules><GML><IncludeGeometryXML>true</IncludeGeometryXML></GML></LayerBuildingRules></Configuration>'])
     lyr = ds.GetLayer(0)
     assert lyr.GetLayerDefn().GetGeomFieldCount() == 2
@@ -517,7 +515,7 @@ class MyHandler(object):
 def test_ogr_gmlas_validate():
 
     # By default check we are silent about validation error
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate.xml', gdal.OF_VECTOR)
     assert ds is not None
     myhandler = MyHandler()
     gdal.PushErrorHandler(myhandler.error_handler)
@@ -528,7 +526,7 @@ def test_ogr_gmlas_validate():
     gdal.PopErrorHandler()
     assert not myhandler.error_list
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate.xml', gdal.OF_VECTOR)
     assert ds is not None
     myhandler = MyHandler()
     gdal.PushErrorHandler(myhandler.error_handler)
@@ -541,27 +539,26 @@ def test_ogr_gmlas_validate():
     # Enable validation on a doc without validation errors
     myhandler = MyHandler()
     gdal.PushErrorHandler(myhandler.error_handler)
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=['VALIDATE=YES'])
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=['VALIDATE=YES'])
     gdal.PopErrorHandler()
     assert ds is not None, myhandler.error_list
     assert not myhandler.error_list
 
     # Enable validation on a doc without validation error, and with explicit XSD
-    gdal.FileFromMemBuffer('/vsimem/gmlas_test1.xml',
-                           open('data/gmlas/gmlas_test1.xml').read())
-    myhandler = MyHandler()
-    gdal.PushErrorHandler(myhandler.error_handler)
-    ds = gdal.OpenEx('GMLAS:/vsimem/gmlas_test1.xml', open_options=[
-        'XSD=' + os.getcwd() + '/data/gmlas/gmlas_test1.xsd', 'VALIDATE=YES'])
-    gdal.PopErrorHandler()
-    gdal.Unlink('/vsimem/gmlas_test1.xml')
+    with gdaltest.tempfile('/vsimem/gmlas_test1.xml',
+                           open('data/gmlas/gmlas_test1.xml').read()):
+        myhandler = MyHandler()
+        gdal.PushErrorHandler(myhandler.error_handler)
+        ds = gdal.OpenEx('GMLAS:/vsimem/gmlas_test1.xml', gdal.OF_VECTOR, open_options=[
+            'XSD=' + os.getcwd() + '/data/gmlas/gmlas_test1.xsd', 'VALIDATE=YES'])
+        gdal.PopErrorHandler()
     assert ds is not None, myhandler.error_list
     assert not myhandler.error_list
 
     # Validation errors, but do not prevent dataset opening
     myhandler = MyHandler()
     gdal.PushErrorHandler(myhandler.error_handler)
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate.xml', open_options=['VALIDATE=YES'])
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate.xml', gdal.OF_VECTOR, open_options=['VALIDATE=YES'])
     gdal.PopErrorHandler()
     assert ds is not None
     assert len(myhandler.error_list) == 5
@@ -569,7 +566,7 @@ def test_ogr_gmlas_validate():
     # Validation errors and do prevent dataset opening
     myhandler = MyHandler()
     gdal.PushErrorHandler(myhandler.error_handler)
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate.xml', open_options=['VALIDATE=YES', 'FAIL_IF_VALIDATION_ERROR=YES'])
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate.xml', gdal.OF_VECTOR, open_options=['VALIDATE=YES', 'FAIL_IF_VALIDATION_ERROR=YES'])
     gdal.PopErrorHandler()
     assert ds is None
     assert len(myhandler.error_list) == 6
@@ -577,7 +574,7 @@ def test_ogr_gmlas_validate():
     # Test that validation without doc doesn't crash
     myhandler = MyHandler()
     gdal.PushErrorHandler(myhandler.error_handler)
-    ds = gdal.OpenEx('GMLAS:', open_options=['XSD=data/gmlas/gmlas_test1.xsd', 'VALIDATE=YES'])
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_test1.xsd', 'VALIDATE=YES'])
     gdal.PopErrorHandler()
     assert ds is not None, myhandler.error_list
     assert not myhandler.error_list
@@ -589,7 +586,7 @@ def test_ogr_gmlas_validate():
 def test_ogr_gmlas_test_ns_prefix():
 
     # The schema doesn't directly import xlink, but indirectly references it
-    ds = gdal.OpenEx('GMLAS:', open_options=['XSD=data/gmlas/gmlas_test_targetelement.xsd'])
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_test_targetelement.xsd'])
 
     lyr = ds.GetLayerByName('_ogr_fields_metadata')
     f = lyr.GetNextFeature()
@@ -604,7 +601,7 @@ def test_ogr_gmlas_test_ns_prefix():
 
 def test_ogr_gmlas_no_namespace():
 
-    ds = ogr.Open('GMLAS:data/gmlas/gmlas_no_namespace.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_no_namespace.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayer(0)
     f = lyr.GetNextFeature()
     if f['foo'] != 'bar':
@@ -620,31 +617,29 @@ def test_ogr_gmlas_conf():
 
     # Non existing file
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=['CONFIG_FILE=not_existing'])
+        ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=['CONFIG_FILE=not_existing'])
     assert ds is None
 
     # Broken conf file
-    gdal.FileFromMemBuffer('/vsimem/my_conf.xml', "<broken>")
-    with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=['CONFIG_FILE=/vsimem/my_conf.xml'])
-    gdal.Unlink('/vsimem/my_conf.xml')
+    with gdaltest.tempfile('/vsimem/my_conf.xml', "<broken>"):
+        with gdaltest.error_handler():
+            ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=['CONFIG_FILE=/vsimem/my_conf.xml'])
     assert ds is None
 
     # Valid XML, but not validating
-    gdal.FileFromMemBuffer('/vsimem/my_conf.xml', "<not_validating/>")
-    with gdaltest.error_handler():
-        gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=['CONFIG_FILE=/vsimem/my_conf.xml'])
-    gdal.Unlink('/vsimem/my_conf.xml')
+    with gdaltest.tempfile('/vsimem/my_conf.xml', "<not_validating/>"):
+        with gdaltest.error_handler():
+            gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=['CONFIG_FILE=/vsimem/my_conf.xml'])
 
     # Inlined conf file + UseArrays = false
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=[
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=[
         'CONFIG_FILE=<Configuration><LayerBuildingRules><UseArrays>false</UseArrays></LayerBuildingRules></Configuration>'])
     assert ds is not None
     lyr = ds.GetLayerByName('main_elt_string_array')
     assert lyr.GetFeatureCount() == 2
 
     # AlwaysGenerateOGRId = true
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=[
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=[
         'CONFIG_FILE=<Configuration><LayerBuildingRules><AlwaysGenerateOGRId>true</AlwaysGenerateOGRId></LayerBuildingRules></Configuration>'])
     assert ds is not None
     lyr = ds.GetLayerByName('main_elt')
@@ -655,7 +650,7 @@ def test_ogr_gmlas_conf():
         pytest.fail()
 
     # IncludeGeometryXML = false
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32.gml', open_options=[
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32.gml', gdal.OF_VECTOR, open_options=[
         'CONFIG_FILE=<Configuration><LayerBuildingRules><GML><IncludeGeometryXML>false</IncludeGeometryXML></GML></LayerBuildingRules></Configuration>'])
     assert ds is not None
     lyr = ds.GetLayer(0)
@@ -669,12 +664,12 @@ def test_ogr_gmlas_conf():
         pytest.fail()
 
     # ExposeMetadataLayers = true
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_abstractgeometry_gml32.gml', open_options=[
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_abstractgeometry_gml32.gml', gdal.OF_VECTOR, open_options=[
         'CONFIG_FILE=<Configuration><ExposeMetadataLayers>true</ExposeMetadataLayers></Configuration>'])
     assert ds is not None
     assert ds.GetLayerCount() == 5
     # Test override with open option
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_abstractgeometry_gml32.gml', open_options=[
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_abstractgeometry_gml32.gml', gdal.OF_VECTOR, open_options=[
         'EXPOSE_METADATA_LAYERS=NO',
         'CONFIG_FILE=<Configuration><ExposeMetadataLayers>true</ExposeMetadataLayers></Configuration>'])
     assert ds is not None
@@ -682,9 +677,9 @@ def test_ogr_gmlas_conf():
 
     # Turn on validation and error on validation
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate.xml', open_options=[
+        ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate.xml', gdal.OF_VECTOR, open_options=[
             'CONFIG_FILE=<Configuration><Validation enabled="true"><FailIfError>true</FailIfError></Validation></Configuration>'])
-    assert ds is None and gdal.GetLastErrorMsg().find('Validation') >= 0
+    assert ds is None and 'Validation' in gdal.GetLastErrorMsg()
 
 ###############################################################################
 # Test IgnoredXPaths aspect of config file
@@ -693,6 +688,12 @@ def test_ogr_gmlas_conf():
 def test_ogr_gmlas_conf_ignored_xpath():
 
     # Test unsupported and invalid XPaths
+    config_file_template = """CONFIG_FILE=<Configuration>
+                        <IgnoredXPaths>
+                            <WarnIfIgnoredXPathFoundInDocInstance>true</WarnIfIgnoredXPathFoundInDocInstance>
+                            <XPath>%s</XPath>
+                        </IgnoredXPaths>
+                    </Configuration>"""
     for xpath in ['',
                   '1',
                   '@',
@@ -705,19 +706,14 @@ def test_ogr_gmlas_conf_ignored_xpath():
                   'foo[1]',
                   "foo[@bar='baz']"]:
         with gdaltest.error_handler():
-            gdal.OpenEx('GMLAS:', open_options=[
+            gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=[
                 'XSD=data/gmlas/gmlas_test1.xsd',
-                """CONFIG_FILE=<Configuration>
-                        <IgnoredXPaths>
-                            <WarnIfIgnoredXPathFoundInDocInstance>true</WarnIfIgnoredXPathFoundInDocInstance>
-                            <XPath>%s</XPath>
-                        </IgnoredXPaths>
-                    </Configuration>""" % xpath])
-        assert gdal.GetLastErrorMsg().find('XPath syntax') >= 0, xpath
+                config_file_template % xpath])
+        assert 'XPath syntax' in gdal.GetLastErrorMsg(), xpath
 
     # Test duplicating mapping
     with gdaltest.error_handler():
-        gdal.OpenEx('GMLAS:', open_options=[
+        gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=[
                     'XSD=data/gmlas/gmlas_test1.xsd',
                     """CONFIG_FILE=<Configuration>
                     <IgnoredXPaths>
@@ -727,10 +723,10 @@ def test_ogr_gmlas_conf_ignored_xpath():
                         </Namespaces>
                     </IgnoredXPaths>
                 </Configuration>"""])
-    assert gdal.GetLastErrorMsg().find('Prefix ns was already mapped') >= 0
+    assert 'Prefix ns was already mapped' in gdal.GetLastErrorMsg()
 
     # Test XPath with implicit namespace, and warning
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=[
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=[
         """CONFIG_FILE=<Configuration>
                 <IgnoredXPaths>
                     <WarnIfIgnoredXPathFoundInDocInstance>true</WarnIfIgnoredXPathFoundInDocInstance>
@@ -742,10 +738,10 @@ def test_ogr_gmlas_conf_ignored_xpath():
     assert lyr.GetLayerDefn().GetFieldIndex('otherns_id') < 0
     with gdaltest.error_handler():
         lyr.GetNextFeature()
-    assert gdal.GetLastErrorMsg().find('Attribute with xpath=myns:main_elt/@otherns:id found in document but ignored') >= 0
+    assert 'Attribute with xpath=myns:main_elt/@otherns:id found in document but ignored' in gdal.GetLastErrorMsg()
 
     # Test XPath with explicit namespace, and warning suppression
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=[
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=[
         """CONFIG_FILE=<Configuration>
                 <IgnoredXPaths>
                     <Namespaces>
@@ -760,7 +756,7 @@ def test_ogr_gmlas_conf_ignored_xpath():
     assert gdal.GetLastErrorMsg() == ''
 
     # Test various XPath syntaxes
-    ds = gdal.OpenEx('GMLAS:', open_options=[
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=[
         'XSD=data/gmlas/gmlas_test1.xsd',
         """CONFIG_FILE=<Configuration>
                 <IgnoredXPaths>
@@ -875,13 +871,13 @@ def test_ogr_gmlas_cache():
 
     # First try with remote schema download disabled
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', open_options=[
+        ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', gdal.OF_VECTOR, open_options=[
             'CONFIG_FILE=<Configuration><AllowRemoteSchemaDownload>false</AllowRemoteSchemaDownload><SchemaCache><Directory>/vsimem/my/gmlas_cache</Directory></SchemaCache></Configuration>'])
-    assert ds is None and gdal.GetLastErrorMsg().find('Cannot resolve') >= 0
+    assert ds is None and gdal.GetLastErrorNo() == gdal.CPLE_FileIO
 
     # Test invalid cache directory
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', open_options=[
+        ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', gdal.OF_VECTOR, open_options=[
             'CONFIG_FILE=<Configuration><SchemaCache><Directory>/inexisting_directory/not/exist</Directory></SchemaCache></Configuration>'])
     if ds is None:
         webserver.server_stop(webserver_process, webserver_port)
@@ -891,7 +887,7 @@ def test_ogr_gmlas_cache():
         pytest.fail(ds.GetLayerCount())
 
     # Will create the directory and download and cache
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', open_options=[
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', gdal.OF_VECTOR, open_options=[
         'CONFIG_FILE=<Configuration><SchemaCache><Directory>/vsimem/my/gmlas_cache</Directory></SchemaCache></Configuration>'])
     if ds is None:
         webserver.server_stop(webserver_process, webserver_port)
@@ -903,7 +899,7 @@ def test_ogr_gmlas_cache():
     gdal.Unlink('/vsimem/my/gmlas_cache/' + gdal.ReadDir('/vsimem/my/gmlas_cache')[0])
 
     # Will reuse the directory and download and cache
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', open_options=[
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', gdal.OF_VECTOR, open_options=[
         'CONFIG_FILE=<Configuration><SchemaCache><Directory>/vsimem/my/gmlas_cache</Directory></SchemaCache></Configuration>'])
     if ds is None:
         webserver.server_stop(webserver_process, webserver_port)
@@ -913,7 +909,7 @@ def test_ogr_gmlas_cache():
         pytest.fail()
 
     # With XSD open option
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', open_options=[
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', gdal.OF_VECTOR, open_options=[
         'XSD=http://localhost:%d/vsimem/ogr_gmlas_cache.xsd' % webserver_port,
         'CONFIG_FILE=<Configuration><SchemaCache><Directory>/vsimem/my/gmlas_cache</Directory></SchemaCache></Configuration>'])
     if ds is None:
@@ -926,17 +922,17 @@ def test_ogr_gmlas_cache():
     webserver.server_stop(webserver_process, webserver_port)
 
     # Now re-open with the webserver turned off
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', open_options=[
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', gdal.OF_VECTOR, open_options=[
         'CONFIG_FILE=<Configuration><SchemaCache><Directory>/vsimem/my/gmlas_cache</Directory></SchemaCache></Configuration>'])
     assert ds is not None
     assert ds.GetLayerCount() == 1
 
     # Re try but ask for refresh
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', open_options=[
+        ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', gdal.OF_VECTOR, open_options=[
             'REFRESH_CACHE=YES',
             'CONFIG_FILE=<Configuration><SchemaCache><Directory>/vsimem/my/gmlas_cache</Directory></SchemaCache></Configuration>'])
-    if ds is not None or gdal.GetLastErrorMsg().find('Cannot resolve') < 0:
+    if ds is not None or gdal.GetLastErrorNo() != gdal.CPLE_FileIO:
         webserver.server_stop(webserver_process, webserver_port)
         pytest.fail(gdal.GetLastErrorMsg())
 
@@ -944,20 +940,16 @@ def test_ogr_gmlas_cache():
     gdal.Unlink('/vsimem/my/gmlas_cache/' + gdal.ReadDir('/vsimem/my/gmlas_cache')[0])
 
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', open_options=[
+        ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_cache.xml', gdal.OF_VECTOR, open_options=[
             'CONFIG_FILE=<Configuration><SchemaCache><Directory>/vsimem/my/gmlas_cache</Directory></SchemaCache></Configuration>'])
-    assert ds is None and gdal.GetLastErrorMsg().find('Cannot resolve') >= 0
+    assert ds is None and gdal.GetLastErrorNo() == gdal.CPLE_FileIO
 
     # Cleanup
     gdal.Unlink('/vsimem/ogr_gmlas_cache.xml')
     gdal.Unlink('/vsimem/ogr_gmlas_cache.xsd')
     gdal.Unlink('/vsimem/ogr_gmlas_cache_2.xsd')
 
-    files = gdal.ReadDir('/vsimem/my/gmlas_cache')
-    for my_file in files:
-        gdal.Unlink('/vsimem/my/gmlas_cache/' + my_file)
-    gdal.Rmdir('/vsimem/my/gmlas_cache')
-    gdal.Rmdir('/vsimem/my')
+    gdal.RmdirRecursive('/vsimem/my')
 
 
 ###############################################################################
@@ -965,7 +957,7 @@ def test_ogr_gmlas_cache():
 
 def test_ogr_gmlas_link_nested_independant_child():
 
-    ds = ogr.Open('GMLAS:data/gmlas/gmlas_link_nested_independant_child.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_link_nested_independant_child.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayer(0)
     f = lyr.GetNextFeature()
     if f['second_my_id'] != 'second_id':
@@ -979,7 +971,7 @@ def test_ogr_gmlas_link_nested_independant_child():
 
 def test_ogr_gmlas_composition_compositionPart():
 
-    ds = ogr.Open('GMLAS:data/gmlas/gmlas_composition_compositionPart.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_composition_compositionPart.xml', gdal.OF_VECTOR)
 
     lyr = ds.GetLayerByName('first_composition')
     f = lyr.GetNextFeature()
@@ -1013,7 +1005,7 @@ def test_ogr_gmlas_instantiate_only_gml_feature():
                        open('data/gmlas/gmlas_instantiate_only_gml_feature.xsd', 'rb').read()):
         with gdaltest.tempfile('/vsimem/with space/gmlas_fake_gml32.xsd',
                        open('data/gmlas/gmlas_fake_gml32.xsd', 'rb').read()):
-            ds = gdal.OpenEx('GMLAS:',
+            ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR,
                             open_options=['XSD=/vsimem/with space/gmlas_instantiate_only_gml_feature.xsd'])
     assert ds.GetLayerCount() == 1
     ds = None
@@ -1024,12 +1016,12 @@ def test_ogr_gmlas_instantiate_only_gml_feature():
 
 def test_ogr_gmlas_timestamp_ignored_for_hash():
 
-    ds = ogr.Open('GMLAS:data/gmlas/gmlas_timestamp_ignored_for_hash_foo.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_timestamp_ignored_for_hash_foo.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayer(0)
     f = lyr.GetNextFeature()
     pkid = f['ogr_pkid']
 
-    ds = ogr.Open('GMLAS:data/gmlas/gmlas_timestamp_ignored_for_hash_bar.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_timestamp_ignored_for_hash_bar.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayer(0)
     f = lyr.GetNextFeature()
     if f['ogr_pkid'] != pkid:
@@ -1043,7 +1035,7 @@ def test_ogr_gmlas_timestamp_ignored_for_hash():
 
 def test_ogr_gmlas_dataset_getnextfeature():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR)
 
     assert ds.TestCapability(ogr.ODsCRandomLayerRead) == 1
 
@@ -1075,7 +1067,7 @@ def test_ogr_gmlas_dataset_getnextfeature():
             break
     assert last_pct == 1.0
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=['EXPOSE_METADATA_LAYERS=YES'])
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=['EXPOSE_METADATA_LAYERS=YES'])
     fc_map = {}
     for layer_name in ('_ogr_fields_metadata',
                        '_ogr_layers_metadata',
@@ -1084,7 +1076,7 @@ def test_ogr_gmlas_dataset_getnextfeature():
         fc_map[layer_name] = ds.GetLayerByName(layer_name).GetFeatureCount()
     ds = None
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=['EXPOSE_METADATA_LAYERS=YES'])
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=['EXPOSE_METADATA_LAYERS=YES'])
     count = 0
     while True:
         f, lyr = ds.GetNextFeature()
@@ -1123,7 +1115,7 @@ def test_ogr_gmlas_dataset_getnextfeature():
                    ['_ogr_layers_metadata', '_ogr_layer_relationships'],
                   ]:
 
-        ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml')
+        ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR)
         expected_count = base_count
         for layer in layers:
             ds.GetLayerByName(layer)
@@ -1143,7 +1135,7 @@ def test_ogr_gmlas_dataset_getnextfeature():
         assert f is None and lyr is None
 
     # Test iterating over metadata layers on XSD-only based dataset
-    ds = gdal.OpenEx('GMLAS:', open_options=['XSD=data/gmlas/gmlas_test1.xsd', 'EXPOSE_METADATA_LAYERS=YES'])
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_test1.xsd', 'EXPOSE_METADATA_LAYERS=YES'])
     count = 0
     last_l = None
     while True:
@@ -1163,7 +1155,7 @@ def test_ogr_gmlas_dataset_getnextfeature():
 
 def test_ogr_gmlas_inline_identifier():
 
-    ds = gdal.OpenEx('GMLAS:', open_options=['XSD=data/gmlas/gmlas_inline_identifier.xsd'])
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_inline_identifier.xsd'])
     if ds.GetLayerCount() != 2:
         for i in range(ds.GetLayerCount()):
             print(ds.GetLayer(i).GetName())
@@ -1177,7 +1169,7 @@ def test_ogr_gmlas_inline_identifier():
 
 def test_ogr_gmlas_avoid_same_name_inlined_classes():
 
-    ds = gdal.OpenEx('GMLAS:', open_options=['XSD=data/gmlas/gmlas_avoid_same_name_inlined_classes.xsd'])
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_avoid_same_name_inlined_classes.xsd'])
     assert ds.GetLayerCount() == 3
     lyr = ds.GetLayerByName('myFeature_ns1_dt')
     assert lyr is not None
@@ -1192,7 +1184,7 @@ def test_ogr_gmlas_validate_ignored_fixed_attribute():
 
     myhandler = MyHandler()
     gdal.PushErrorHandler(myhandler.error_handler)
-    gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate_ignored_fixed_attribute.xml',
+    gdal.OpenEx('GMLAS:data/gmlas/gmlas_validate_ignored_fixed_attribute.xml', gdal.OF_VECTOR,
                 open_options=['VALIDATE=YES',
                               'CONFIG_FILE=<Configuration><IgnoredXPaths><XPath>@bar</XPath></IgnoredXPaths></Configuration>'])
     gdal.PopErrorHandler()
@@ -1204,7 +1196,7 @@ def test_ogr_gmlas_validate_ignored_fixed_attribute():
 
 def test_ogr_gmlas_remove_unused_layers_and_fields():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_remove_unused_layers_and_fields.xml',
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_remove_unused_layers_and_fields.xml', gdal.OF_VECTOR,
                      open_options=['REMOVE_UNUSED_LAYERS=YES',
                                    'REMOVE_UNUSED_FIELDS=YES'])
     assert ds.GetLayerCount() == 1
@@ -1306,7 +1298,7 @@ def test_ogr_gmlas_xlink_resolver():
 </FeatureCollection>""" % (webserver_port, webserver_port))
 
     # By default, no resolution
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml')
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayer(0)
     if lyr.GetLayerDefn().GetFieldIndex('my_link_rawcontent') >= 0:
         webserver.server_stop(webserver_process, webserver_port)
@@ -1314,7 +1306,7 @@ def test_ogr_gmlas_xlink_resolver():
     ds = None
 
     # Enable resolution, but only from local cache
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml',
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml', gdal.OF_VECTOR,
                      open_options=["""CONFIG_FILE=<Configuration>
         <XLinkResolution>
             <CacheDirectory>/vsimem/gmlas_xlink_cache</CacheDirectory>
@@ -1346,7 +1338,7 @@ def test_ogr_gmlas_xlink_resolver():
     gdal.FileFromMemBuffer('/vsimem/resource.xml', 'bar')
     gdal.FileFromMemBuffer('/vsimem/resource2.xml', 'baz')
     gdal.SetConfigOption('GMLAS_XLINK_RAM_CACHE_SIZE', '5')
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml',
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml', gdal.OF_VECTOR,
                      open_options=["""CONFIG_FILE=<Configuration>
         <XLinkResolution>
             <CacheDirectory>/vsimem/gmlas_xlink_cache</CacheDirectory>
@@ -1396,7 +1388,7 @@ def test_ogr_gmlas_xlink_resolver():
 
     # Enable remote resolution and caching
     gdal.FileFromMemBuffer('/vsimem/resource.xml', 'bar')
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml',
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml', gdal.OF_VECTOR,
                      open_options=["""CONFIG_FILE=<Configuration>
         <XLinkResolution>
             <CacheDirectory>/vsimem/gmlas_xlink_cache</CacheDirectory>
@@ -1418,7 +1410,7 @@ def test_ogr_gmlas_xlink_resolver():
 
     # Enable remote resolution and caching and REFRESH_CACHE
     gdal.FileFromMemBuffer('/vsimem/resource.xml', 'baz')
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml',
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml', gdal.OF_VECTOR,
                      open_options=['REFRESH_CACHE=YES', """CONFIG_FILE=<Configuration>
         <XLinkResolution>
             <CacheDirectory>/vsimem/gmlas_xlink_cache</CacheDirectory>
@@ -1446,7 +1438,7 @@ def test_ogr_gmlas_xlink_resolver():
           xsi:noNamespaceSchemaLocation="ogr_gmlas_xlink_resolver.xsd">
     <my_link xlink:href="http://localhost:%d/vsimem/resource_not_existing.xml"/>
 </main_elt>""" % webserver_port)
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver_absent_resource.xml',
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver_absent_resource.xml', gdal.OF_VECTOR,
                      open_options=["""CONFIG_FILE=<Configuration>
         <XLinkResolution>
             <CacheDirectory>/vsimem/gmlas_xlink_cache</CacheDirectory>
@@ -1465,7 +1457,7 @@ def test_ogr_gmlas_xlink_resolver():
 
     # Test file size limit
     gdal.Unlink(cached_file)
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml',
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml', gdal.OF_VECTOR,
                      open_options=["""CONFIG_FILE=<Configuration>
         <XLinkResolution>
             <MaxFileSize>1</MaxFileSize>
@@ -1489,7 +1481,7 @@ def test_ogr_gmlas_xlink_resolver():
 
     # Test with URL specific rule with RawContent resolution
     gdal.FileFromMemBuffer('/vsimem/resource.xml', 'bar')
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml',
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml', gdal.OF_VECTOR,
                      open_options=["""CONFIG_FILE=<Configuration>
         <XLinkResolution>
             <CacheDirectory>/vsimem/gmlas_xlink_cache</CacheDirectory>
@@ -1615,7 +1607,7 @@ def test_ogr_gmlas_xlink_resolver():
             </URLSpecificResolution>
         </XLinkResolution></Configuration>""" % (webserver_port, webserver_port)
 
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml',
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml', gdal.OF_VECTOR,
                      open_options=['CONFIG_FILE=' + config_file])
     lyr = ds.GetLayer(0)
     f = lyr.GetNextFeature()
@@ -1649,7 +1641,7 @@ bar""" or \
     gdal.Unlink('/vsimem/subdir2/resource2_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_very_long.xml')
 
     # Test caching
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml',
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_xlink_resolver.xml', gdal.OF_VECTOR,
                      open_options=['CONFIG_FILE=' + config_file])
     lyr = ds.GetLayer(0)
     f = lyr.GetNextFeature()
@@ -1676,15 +1668,11 @@ bar""" or \
     gdal.Unlink('/vsimem/ogr_gmlas_xlink_resolver_fake_xlink.xsd')
     gdal.Unlink('/vsimem/ogr_gmlas_xlink_resolver.xml')
     gdal.Unlink('/vsimem/ogr_gmlas_xlink_resolver_absent_resource.xml')
-    fl = gdal.ReadDir('/vsimem/gmlas_xlink_cache')
-    if fl is not None:
-        for filename in fl:
-            gdal.Unlink('/vsimem/gmlas_xlink_cache/' + filename)
-    gdal.Unlink('/vsimem/gmlas_xlink_cache')
+    gdal.RmdirRecursive('/vsimem/gmlas_xlink_cache')
     gdal.Unlink('/vsimem/resource.xml')
     gdal.Unlink('/vsimem/resource2.xml')
-    gdal.Unlink('/vsimem/subdir1/resource.xml')
-    gdal.Unlink('/vsimem/subdir2/resource2_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_super_very_long.xml')
+    gdal.RmdirRecursive('/vsimem/subdir1')
+    gdal.RmdirRecursive('/vsimem/subdir2')
     gdal.Unlink('/vsimem/non_matching_resource.xml')
 
 ###############################################################################
@@ -1693,7 +1681,7 @@ bar""" or \
 
 def test_ogr_gmlas_recoding():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_recoding.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_recoding.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayer(0)
     f = lyr.GetNextFeature()
     if f['attr'] != '\u00e9':
@@ -1708,7 +1696,7 @@ def test_ogr_gmlas_recoding():
 def test_ogr_gmlas_schema_without_namespace_prefix():
 
     # Generic http:// namespace URI
-    ds = gdal.OpenEx('GMLAS:', open_options=['XSD=data/gmlas/gmlas_schema_without_namespace_prefix_generic_http_uri.xsd'])
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_schema_without_namespace_prefix_generic_http_uri.xsd'])
     lyr = ds.GetLayerByName('_ogr_layers_metadata')
     f = lyr.GetNextFeature()
     if f['layer_xpath'] != 'my_ns:main_elt':
@@ -1719,7 +1707,7 @@ def test_ogr_gmlas_schema_without_namespace_prefix():
 
     # http://www.opengis.net/ namespace URI
 
-    ds = gdal.OpenEx('GMLAS:', open_options=['XSD=data/gmlas/gmlas_schema_without_namespace_prefix_opengis_uri.xsd'])
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_schema_without_namespace_prefix_opengis_uri.xsd'])
     lyr = ds.GetLayerByName('_ogr_layers_metadata')
     f = lyr.GetNextFeature()
     if f['layer_xpath'] != 'fake_3_0:main_elt':
@@ -1730,7 +1718,7 @@ def test_ogr_gmlas_schema_without_namespace_prefix():
 
     # Non http:// namespace URI
 
-    ds = gdal.OpenEx('GMLAS:', open_options=['XSD=data/gmlas/gmlas_schema_without_namespace_prefix_non_http_uri.xsd'])
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_schema_without_namespace_prefix_non_http_uri.xsd'])
     lyr = ds.GetLayerByName('_ogr_layers_metadata')
     f = lyr.GetNextFeature()
     if f['layer_xpath'] != 'my_namespace:main_elt':
@@ -1744,7 +1732,7 @@ def test_ogr_gmlas_schema_without_namespace_prefix():
 
 def test_ogr_gmlas_truncated_xml():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_truncated_xml.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_truncated_xml.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayer(0)
     with gdaltest.error_handler():
         f = lyr.GetNextFeature()
@@ -1759,7 +1747,7 @@ def test_ogr_gmlas_truncated_xml():
 
 def test_ogr_gmlas_identifier_truncation():
 
-    ds = gdal.OpenEx('GMLAS:', open_options=[
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=[
         'XSD=data/gmlas/gmlas_identifier_truncation.xsd',
         'CONFIG_FILE=<Configuration><LayerBuildingRules><IdentifierMaxLength>10</IdentifierMaxLength><PostgreSQLIdentifierLaundering>false</PostgreSQLIdentifierLaundering></LayerBuildingRules></Configuration>'])
     lyr = ds.GetLayerByName('v_l_i_clas')
@@ -1792,7 +1780,7 @@ def test_ogr_gmlas_identifier_truncation():
 
 def test_ogr_gmlas_identifier_case_ambiguity():
 
-    ds = gdal.OpenEx('GMLAS:', open_options=[
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=[
         'XSD=data/gmlas/gmlas_identifier_case_ambiguity.xsd',
         'CONFIG_FILE=<Configuration><LayerBuildingRules><PostgreSQLIdentifierLaundering>false</PostgreSQLIdentifierLaundering></LayerBuildingRules></Configuration>'])
     lyr = ds.GetLayerByName('differentcase1')
@@ -1814,7 +1802,7 @@ def test_ogr_gmlas_writer():
     if ogr.GetDriverByName('SQLite') is None:
         pytest.skip()
 
-    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=['EXPOSE_METADATA_LAYERS=YES'])
+    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=['EXPOSE_METADATA_LAYERS=YES'])
     tmp_ds = gdal.VectorTranslate('/vsimem/ogr_gmlas_writer.db', src_ds, format='SQLite')
     src_ds = None
     ret_ds = gdal.VectorTranslate('tmp/gmlas_test1_generated.xml', tmp_ds,
@@ -1940,7 +1928,7 @@ def test_ogr_gmlas_writer_check_xml_read_back():
 
 def test_ogr_gmlas_writer_gml():
 
-    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml',
+    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml', gdal.OF_VECTOR,
                          open_options=['EXPOSE_METADATA_LAYERS=YES', '@HASH=hash'])
     tmp_ds = gdal.VectorTranslate('', src_ds, format='Memory')
     src_ds = None
@@ -1978,7 +1966,7 @@ def test_ogr_gmlas_writer_gml():
 
 def test_ogr_gmlas_writer_gml_assign_srs():
 
-    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml',
+    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml', gdal.OF_VECTOR,
                          open_options=['EXPOSE_METADATA_LAYERS=YES', '@HASH=hash'])
     tmp_ds = gdal.VectorTranslate('', src_ds, format='Memory')
     src_ds = None
@@ -2003,7 +1991,7 @@ def test_ogr_gmlas_writer_gml_assign_srs():
 
     # No geometry, but to test that the proxied ExecuteSQL() works
 
-    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', open_options=['EXPOSE_METADATA_LAYERS=YES'])
+    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_test1.xml', gdal.OF_VECTOR, open_options=['EXPOSE_METADATA_LAYERS=YES'])
     tmp_ds = gdal.VectorTranslate('/vsimem/ogr_gmlas_writer.db', src_ds, format='SQLite')
     src_ds = None
     gdal.VectorTranslate('/vsimem/gmlas_test1_generated_ref0.xml', tmp_ds,
@@ -2032,7 +2020,7 @@ def test_ogr_gmlas_writer_gml_assign_srs():
 
 def test_ogr_gmlas_writer_gml_original_xml():
 
-    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml',
+    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml', gdal.OF_VECTOR,
                          open_options=['EXPOSE_METADATA_LAYERS=YES',
                                        'CONFIG_FILE=<Configuration><LayerBuildingRules><GML><IncludeGeometryXML>true</IncludeGeometryXML></GML></LayerBuildingRules></Configuration>'])
     tmp_ds = gdal.VectorTranslate('', src_ds, format='Memory')
@@ -2044,7 +2032,7 @@ def test_ogr_gmlas_writer_gml_original_xml():
     assert ret_ds is not None
     ret_ds = None
 
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_writer_gml.xml', open_options=['VALIDATE=YES'])
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_writer_gml.xml', gdal.OF_VECTOR, open_options=['VALIDATE=YES'])
     assert ds is not None and gdal.GetLastErrorMsg() == ''
     ds = None
 
@@ -2068,7 +2056,7 @@ def test_ogr_gmlas_writer_gml_original_xml():
 
 def test_ogr_gmlas_writer_options():
 
-    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml', open_options=['@HASH=hash'])
+    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml', gdal.OF_VECTOR, open_options=['@HASH=hash'])
     tmp_ds = gdal.VectorTranslate('', src_ds, format='Memory')
     src_ds = None
     ret_ds = gdal.VectorTranslate('/vsimem/ogr_gmlas_writer_options.xml', tmp_ds, format='GMLAS',
@@ -2107,7 +2095,7 @@ def test_ogr_gmlas_writer_options():
     assert '<ogr:geometryProperty><gml:Point srsName="urn:ogc:def:crs:EPSG::4326" gml:id="hash_test_1.geom0"><gml:pos>49 2</gml:pos></gml:Point></ogr:geometryProperty>' in content
 
     # Test TIMESTAMP option
-    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml',
+    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml', gdal.OF_VECTOR,
                          open_options=['@HASH=hash', 'EXPOSE_METADATA_LAYERS=YES'])
     tmp_ds = gdal.VectorTranslate('', src_ds, format='Memory')
     src_ds = None
@@ -2130,7 +2118,7 @@ def test_ogr_gmlas_writer_options():
        'xsi:schemaLocation="http://www.opengis.net/wfs/2.0 http://schemas.opengis.net/wfs/2.0/wfs.xsd ' in content)
 
     # Test WFS20_SCHEMALOCATION option
-    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml',
+    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml', gdal.OF_VECTOR,
                          open_options=['@HASH=hash', 'EXPOSE_METADATA_LAYERS=YES'])
     tmp_ds = gdal.VectorTranslate('', src_ds, format='Memory')
     src_ds = None
@@ -2158,7 +2146,7 @@ def test_ogr_gmlas_writer_options():
     </xs:element>
 </xs:schema>
 """)
-    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_writer_options.xml', open_options=['VALIDATE=YES'])
+    ds = gdal.OpenEx('GMLAS:/vsimem/ogr_gmlas_writer_options.xml', gdal.OF_VECTOR, open_options=['VALIDATE=YES'])
     gdal.Unlink('/vsimem/fake_wfs.xsd')
 
     assert ds is not None and gdal.GetLastErrorMsg() == ''
@@ -2184,57 +2172,57 @@ def test_ogr_gmlas_writer_errors():
     # Source dataset is empty
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/vsimem/valid.xml', gdal.GetDriverByName('Memory').Create('', 0, 0, 0, 0), format='GMLAS')
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('Source dataset has no layers') >= 0
+    assert ret_ds is None and 'Source dataset has no layers' in gdal.GetLastErrorMsg()
 
     # Missing input schemas
-    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml')
+    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml', gdal.OF_VECTOR)
     tmp_ds = gdal.VectorTranslate('', src_ds, format='Memory')
     src_ds = None
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/vsimem/valid.xml', tmp_ds, format='GMLAS')
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('Cannot establish schema since no INPUT_XSD creation option specified and no _ogr_other_metadata found in source dataset') >= 0
+    assert ret_ds is None and 'Cannot establish schema since no INPUT_XSD creation option specified and no _ogr_other_metadata found in source dataset' in gdal.GetLastErrorMsg()
 
     # Invalid input schema
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/vsimem/valid.xml', tmp_ds, format='GMLAS',
                                       datasetCreationOptions=['INPUT_XSD=/i_do_not/exist.xsd'])
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('Cannot resolve /i_do_not/exist.xsd') >= 0
+    assert ret_ds is None and 'Cannot resolve /i_do_not/exist.xsd' in gdal.GetLastErrorMsg()
 
     # Invalid output .xml name
-    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml',
+    src_ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometryproperty_gml32_no_error.gml', gdal.OF_VECTOR,
                          open_options=['EXPOSE_METADATA_LAYERS=YES'])
     tmp_ds = gdal.VectorTranslate('', src_ds, format='Memory')
     src_ds = None
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/i_am/not/valid.xml', tmp_ds, format='GMLAS',
                                       datasetCreationOptions=['GENERATE_XSD=NO'])
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('Cannot create /i_am/not/valid.xml') >= 0
+    assert ret_ds is None and 'Cannot create /i_am/not/valid.xml' in gdal.GetLastErrorMsg()
 
     # .xsd extension not allowed
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/i_am/not/valid.xsd', tmp_ds, format='GMLAS',
                                       datasetCreationOptions=['GENERATE_XSD=NO'])
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('.xsd extension is not valid') >= 0
+    assert ret_ds is None and '.xsd extension is not valid' in gdal.GetLastErrorMsg()
 
     # Invalid output .xsd name
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/vsimem/valid.xml', tmp_ds, format='GMLAS',
                                       datasetCreationOptions=['WRAPPING=GMLAS_FEATURECOLLECTION',
                                                               'OUTPUT_XSD_FILENAME=/i_am/not/valid.xsd'])
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('Cannot create /i_am/not/valid.xsd') >= 0
+    assert ret_ds is None and 'Cannot create /i_am/not/valid.xsd' in gdal.GetLastErrorMsg()
     gdal.Unlink('/vsimem/valid.xml')
 
     # Invalid CONFIG_FILE
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/vsimem/valid.xml', tmp_ds, format='GMLAS',
                                       datasetCreationOptions=['CONFIG_FILE=/i/do_not/exist'])
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('Loading of configuration failed') >= 0
+    assert ret_ds is None and 'Loading of configuration failed' in gdal.GetLastErrorMsg()
 
     # Invalid layer name
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/vsimem/valid.xml', tmp_ds, format='GMLAS',
                                       datasetCreationOptions=['LAYERS=foo'])
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('Layer foo specified in LAYERS option does not exist') >= 0
+    assert ret_ds is None and 'Layer foo specified in LAYERS option does not exist' in gdal.GetLastErrorMsg()
     gdal.Unlink('/vsimem/valid.xml')
 
     # _ogr_layers_metadata not found
@@ -2242,7 +2230,7 @@ def test_ogr_gmlas_writer_errors():
     src_ds.CreateLayer('_ogr_other_metadata')
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/vsimem/valid.xml', src_ds, format='GMLAS')
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('_ogr_layers_metadata not found') >= 0
+    assert ret_ds is None and '_ogr_layers_metadata not found' in gdal.GetLastErrorMsg()
 
     # _ogr_fields_metadata not found
     src_ds = gdal.GetDriverByName('Memory').Create('', 0, 0, 0, 0)
@@ -2250,7 +2238,7 @@ def test_ogr_gmlas_writer_errors():
     src_ds.CreateLayer('_ogr_layers_metadata')
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/vsimem/valid.xml', src_ds, format='GMLAS')
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('_ogr_fields_metadata not found') >= 0
+    assert ret_ds is None and '_ogr_fields_metadata not found' in gdal.GetLastErrorMsg()
 
     # _ogr_layer_relationships not found
     src_ds = gdal.GetDriverByName('Memory').Create('', 0, 0, 0, 0)
@@ -2259,7 +2247,7 @@ def test_ogr_gmlas_writer_errors():
     src_ds.CreateLayer('_ogr_fields_metadata')
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/vsimem/valid.xml', src_ds, format='GMLAS')
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('_ogr_layer_relationships not found') >= 0
+    assert ret_ds is None and '_ogr_layer_relationships not found' in gdal.GetLastErrorMsg()
 
     # Cannot find field layer_name in _ogr_layers_metadata layer
     src_ds = gdal.GetDriverByName('Memory').Create('', 0, 0, 0, 0)
@@ -2269,7 +2257,7 @@ def test_ogr_gmlas_writer_errors():
     src_ds.CreateLayer('_ogr_layer_relationships')
     with gdaltest.error_handler():
         ret_ds = gdal.VectorTranslate('/vsimem/valid.xml', src_ds, format='GMLAS')
-    assert ret_ds is None and gdal.GetLastErrorMsg().find('Cannot find field layer_name in _ogr_layers_metadata layer') >= 0
+    assert ret_ds is None and 'Cannot find field layer_name in _ogr_layers_metadata layer' in gdal.GetLastErrorMsg()
     gdal.Unlink('/vsimem/valid.xml')
     gdal.Unlink('/vsimem/valid.xsd')
 
@@ -2280,7 +2268,7 @@ def test_ogr_gmlas_writer_errors():
 
 def test_ogr_gmlas_read_fake_gmljp2():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/fake_gmljp2.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/fake_gmljp2.xml', gdal.OF_VECTOR)
 
     count = 0
     while True:
@@ -2299,7 +2287,7 @@ def test_ogr_gmlas_read_fake_gmljp2():
 def test_ogr_gmlas_typing_constraints():
 
     # One substitution, no repetition
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_typing_constraints_one_subst_no_repetition.xml',
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_typing_constraints_one_subst_no_repetition.xml', gdal.OF_VECTOR,
                      open_options=["""CONFIG_FILE=<Configuration>
 <TypingConstraints>
         <Namespaces>
@@ -2327,7 +2315,7 @@ def test_ogr_gmlas_typing_constraints():
 
     # One substitution, with repetition
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_typing_constraints_one_subst_with_repetition.xml',
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_typing_constraints_one_subst_with_repetition.xml', gdal.OF_VECTOR,
                      open_options=["""CONFIG_FILE=<Configuration>
 <TypingConstraints>
         <Namespaces>
@@ -2355,7 +2343,7 @@ def test_ogr_gmlas_typing_constraints():
     ds = None
 
     # 2 substitutions
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_typing_constraints_two_subst.xml',
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_typing_constraints_two_subst.xml', gdal.OF_VECTOR,
                      open_options=["""CONFIG_FILE=<Configuration>
 <TypingConstraints>
         <Namespaces>
@@ -2391,7 +2379,7 @@ def test_ogr_gmlas_typing_constraints():
 
 def test_ogr_gmlas_swe_dataarray():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_swe_dataarray.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_swe_dataarray.xml', gdal.OF_VECTOR)
 
     lyr = ds.GetLayerByName('dataarray_1_components')
     f = lyr.GetNextFeature()
@@ -2460,11 +2448,11 @@ def test_ogr_gmlas_swe_dataarray():
 def test_ogr_gmlas_swe_datarecord():
 
     gdal.ErrorReset()
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_swe_datarecord.xml', open_options=['VALIDATE=YES'])
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_swe_datarecord.xml', gdal.OF_VECTOR, open_options=['VALIDATE=YES'])
     assert gdal.GetLastErrorMsg() == ''
     ds = None
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_swe_datarecord.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_swe_datarecord.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayerByName('main_elt_foo')
     assert lyr.GetLayerDefn().GetFieldCount() == 12
     f = lyr.GetNextFeature()
@@ -2490,7 +2478,7 @@ def test_ogr_gmlas_any_field_at_end_of_declaration():
     # http://schemas.earthresourceml.org/earthresourceml-lite/1.0/erml-lite.xsd
     # http://services.ga.gov.au/earthresource/ows?service=wfs&version=2.0.0&request=GetFeature&typenames=erl:CommodityResourceView&count=10
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_any_field_at_end_of_declaration.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_any_field_at_end_of_declaration.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayerByName('main_elt')
     # Will warn about 'Unexpected element with xpath=main_elt/extra (subxpath=main_elt/extra) found'
     # This should be fixed at some point
@@ -2511,7 +2499,7 @@ def test_ogr_gmlas_any_field_at_end_of_declaration():
 
 def test_ogr_gmlas_aux_schema_without_namespace_prefix():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_aux_schema_without_namespace_prefix.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_aux_schema_without_namespace_prefix.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayerByName('main_elt')
     f = lyr.GetNextFeature()
     if not f.IsFieldSetAndNotNull('generic_pkid'):
@@ -2526,7 +2514,7 @@ def test_ogr_gmlas_aux_schema_without_namespace_prefix():
 
 def test_ogr_gmlas_geometry_as_substitutiongroup():
 
-    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometry_as_substitutiongroup.xml')
+    ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_geometry_as_substitutiongroup.xml', gdal.OF_VECTOR)
     lyr = ds.GetLayerByName('foo')
     f = lyr.GetNextFeature()
     if f.GetGeometryRef() is None:
@@ -2561,7 +2549,7 @@ def test_ogr_gmlas_extra_eureg():
 
 def test_ogr_gmlas_no_element_in_first_choice_schema():
 
-    ds = gdal.OpenEx('GMLAS:', open_options=['XSD=data/gmlas/gmlas_no_element_in_first_choice_schema.xsd'])
+    ds = gdal.OpenEx('GMLAS:', gdal.OF_VECTOR, open_options=['XSD=data/gmlas/gmlas_no_element_in_first_choice_schema.xsd'])
     lyr = ds.GetLayerByName('_ogr_layers_metadata')
     f = lyr.GetNextFeature()
     if f['layer_xpath'] != 'my_ns:main_elt':
@@ -2576,7 +2564,7 @@ def test_ogr_gmlas_no_element_in_first_choice_schema():
 def test_ogr_gmlas_internal_xlink_href():
 
     with gdaltest.error_handler():
-        ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_internal_xlink_href.xml')
+        ds = gdal.OpenEx('GMLAS:data/gmlas/gmlas_internal_xlink_href.xml', gdal.OF_VECTOR)
         lyr = ds.GetLayerByName('main_elt')
         f = lyr.GetNextFeature()
     if f['link_to_second_or_third_elt_href'] != '#does_not_exist' or \